@@ -6,12 +6,16 @@ Supports Windows, macOS, and Linux
 
 import os
 import sys
+import functools
+import hashlib
 import subprocess
 import shutil
 import platform
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=1)
 def get_platform_info():
     """Get current platform information."""
     system = platform.system().lower()
@@ -29,59 +33,67 @@ def get_platform_info():
 
 def install_pyinstaller():
     """Install PyInstaller if not already installed."""
-    try:
-        import PyInstaller
+    import importlib.util
 
+    if importlib.util.find_spec("PyInstaller") is not None:
         print("PyInstaller is already installed.")
         return True
-    except ImportError:
-        print("Installing PyInstaller...")
-        try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
-            print("PyInstaller installed successfully.")
-            return True
-        except subprocess.CalledProcessError as e:
-            print(f"Failed to install PyInstaller: {e}")
-            return False
+
+    print("Installing PyInstaller...")
+    try:
+        subprocess.check_call(
+            [
+                sys.executable,
+                "-m",
+                "pip",
+                "install",
+                "--prefer-binary",
+                "--only-binary=:all:",
+                "--no-warn-script-location",
+                "--disable-pip-version-check",
+                "pyinstaller",
+            ]
+        )
+        print("PyInstaller installed successfully.")
+        return True
+    except subprocess.CalledProcessError as e:
+        print(f"Failed to install PyInstaller: {e}")
+        return False
+
+
+# DLLs that UPX either corrupts (VC runtime, api-set stubs) or that start
+# slower when compressed (python3X.dll loses demand-paging)
+UPX_EXCLUDES = [
+    "vcruntime140.dll",
+    "VCRUNTIME140_1.dll",
+    "python3*.dll",
+    "qwindows.dll",
+    "api-ms-win-*.dll",
+]
+
+# Build configuration shared by every platform; macOS adds its
+# codesigning keys on top in create_spec_file
+BASE_CONFIG = {
+    "console": False,
+    "upx": True,
+    "icon": "baresha-logo.jpg",
+    "datas": [
+        ("baresha-logo.jpg", "."),
+        ("ffmpeg", "ffmpeg"),
+        ("install_ffmpeg.py", "."),
+    ],
+}
 
 
 def create_spec_file(platform_name, extension):
     """Create a PyInstaller spec file for the application."""
 
-    # Platform-specific configurations
-    platform_configs = {
-        "windows": {
-            "console": False,
-            "icon": "baresha-logo.jpg",
-            "datas": [
-                ("baresha-logo.jpg", "."),
-                ("ffmpeg", "ffmpeg"),
-                ("install_ffmpeg.py", "."),
-            ],
-        },
-        "macos": {
-            "console": False,
-            "icon": "baresha-logo.jpg",
-            "datas": [
-                ("baresha-logo.jpg", "."),
-                ("ffmpeg", "ffmpeg"),
-                ("install_ffmpeg.py", "."),
-            ],
-            "codesign_identity": None,
-            "entitlements_file": None,
-        },
-        "linux": {
-            "console": False,
-            "icon": "baresha-logo.jpg",
-            "datas": [
-                ("baresha-logo.jpg", "."),
-                ("ffmpeg", "ffmpeg"),
-                ("install_ffmpeg.py", "."),
-            ],
-        },
-    }
-
-    config = platform_configs.get(platform_name, platform_configs["linux"])
+    config = dict(BASE_CONFIG)
+    if platform_name == "macos":
+        # UPX is a no-op for Mach-O binaries in modern versions
+        config.update(codesign_identity=None, entitlements_file=None, upx=False)
+    if platform.machine().lower() in ("arm64", "aarch64"):
+        config["upx"] = False
 
     spec_content = f"""# -*- mode: python ; coding: utf-8 -*-
 
@@ -93,38 +105,33 @@ a = Analysis(
     binaries=[],
     datas={config["datas"]},
     hiddenimports=[
-        'yt_dlp',
-        'PIL',
-        'PIL.Image',
+        # Only modules PyInstaller cannot discover from static imports
         'PIL.ImageTk',
-        'tkinter',
-        'tkinter.ttk',
-        'tkinter.filedialog',
-        'tkinter.messagebox',
-        'tkinter.scrolledtext',
-        'requests',
-        'urllib.request',
-        'urllib.parse',
-        'json',
-        'datetime',
-        'collections',
-        'threading',
-        'subprocess',
-        'pathlib',
-        'time',
-        're',
-        'sys',
-        'os',
         'sv_ttk',
         'darkdetect',
         'pystray',
-        'plyer',
         'plyer.notification',
+        'tkinterdnd2',
     ],
     hookspath=[],
     hooksconfig={{}},
     runtime_hooks=[],
-    excludes=[],
+    excludes=[
+        'test',
+        'tests',
+        'unittest',
+        'pydoc_data',
+        'tkinter.test',
+        'distutils',
+        'setuptools',
+        'pip',
+        'PIL.ImageQt',
+        'PyQt5',
+        'PySide2',
+        'matplotlib',
+        'scipy',
+        'numpy',
+    ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
@@ -144,8 +151,8 @@ exe = EXE(
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
-    upx_exclude=[],
+    upx={config["upx"]},
+    upx_exclude={UPX_EXCLUDES},
     runtime_tmpdir=None,
     console={config["console"]},
     disable_windowed_traceback=False,
@@ -158,12 +165,31 @@ exe = EXE(
 """
 
     spec_filename = f"Baresha-Downloader-{platform_name}.spec"
-    with open(spec_filename, "w") as f:
-        f.write(spec_content)
+    spec_path = Path(spec_filename)
+
+    # Leave an identical spec untouched so its timestamp does not
+    # invalidate PyInstaller's incremental analysis cache
+    if spec_path.exists() and spec_path.read_text() == spec_content:
+        print(f"PyInstaller spec file up to date: {spec_filename}")
+        return spec_filename
+
+    spec_path.write_text(spec_content)
     print(f"Created PyInstaller spec file: {spec_filename}")
     return spec_filename
 
 
+def get_build_cache_key(spec_filename):
+    """Hash the build inputs so unchanged sources can reuse a cached dist."""
+    digest = hashlib.sha256()
+    for input_file in ("youtube_downloader.py", spec_filename, "requirements.txt", "baresha-logo.jpg"):
+        try:
+            with open(input_file, "rb") as f:
+                digest.update(f.read())
+        except OSError:
+            pass
+    return digest.hexdigest()
+
+
 def build_executable(platform_name, extension):
     """Build the executable using PyInstaller."""
     print(f"Building executable for {platform_name}...")
@@ -171,22 +197,41 @@ def build_executable(platform_name, extension):
     # Create spec file
     spec_filename = create_spec_file(platform_name, extension)
 
-    # Build the executable
+    # Skip PyInstaller entirely when nothing that feeds the build has changed
+    cache_dir = Path(".build_cache") / get_build_cache_key(spec_filename)
+    if cache_dir.exists():
+        print("Build inputs unchanged - restoring executable from cache.")
+        shutil.rmtree("dist", ignore_errors=True)
+        shutil.copytree(cache_dir, "dist")
+        print(f"Executable restored from cache for {platform_name}!")
+        return True
+
+    # Build the executable (no --clean: PyInstaller's own work cache in
+    # build/ speeds up incremental rebuilds)
+    build_cmd = [sys.executable, "-m", "PyInstaller", "--noconfirm", spec_filename]
+    upx_path = shutil.which("upx")
+    if upx_path:
+        build_cmd += ["--upx-dir", os.path.dirname(upx_path)]
     try:
-        subprocess.check_call([sys.executable, "-m", "PyInstaller", "--clean", "--noconfirm", spec_filename])
+        subprocess.check_call(build_cmd)
         print(f"Executable built successfully for {platform_name}!")
-        return True
     except subprocess.CalledProcessError as e:
         print(f"Failed to build executable for {platform_name}: {e}")
         return False
 
+    # Store the artifact for future runs with the same inputs
+    if Path("dist").exists():
+        shutil.copytree("dist", cache_dir)
+    return True
 
-def create_installer_scripts(platform_name, extension):
-    """Create installer scripts for the current platform."""
 
-    if platform_name == "windows":
-        # Windows installer
-        installer_content = """@echo off
+# Installer script templates, keyed by platform. Only the one for the
+# current platform is written out.
+INSTALLER_TEMPLATES = {
+    "windows": {
+        "filename": "install.bat",
+        "executable": False,
+        "content": """@echo off
 echo Baresha Downloader - Installer
 echo ==============================
 
@@ -213,14 +258,12 @@ echo The application has been installed to: %INSTALL_DIR%
 echo Desktop shortcut created.
 echo Start menu shortcut created.
 pause
-"""
-        with open("install.bat", "w") as f:
-            f.write(installer_content)
-        print("Created Windows installer script: install.bat")
-
-    elif platform_name == "macos":
-        # macOS installer
-        installer_content = """#!/bin/bash
+""",
+    },
+    "macos": {
+        "filename": "install.sh",
+        "executable": True,
+        "content": """#!/bin/bash
 echo "Baresha Downloader - Installer"
 echo "=============================="
 
@@ -245,16 +288,12 @@ echo "The application has been installed to: $INSTALL_DIR"
 echo "Desktop shortcut created."
 echo ""
 echo "You can now launch Baresha Downloader from Applications or Desktop."
-"""
-        with open("install.sh", "w") as f:
-            f.write(installer_content)
-        # Make executable
-        os.chmod("install.sh", 0o755)
-        print("Created macOS installer script: install.sh")
-
-    elif platform_name == "linux":
-        # Linux installer
-        installer_content = """#!/bin/bash
+""",
+    },
+    "linux": {
+        "filename": "install.sh",
+        "executable": True,
+        "content": """#!/bin/bash
 echo "Baresha Downloader - Installer"
 echo "=============================="
 
@@ -295,12 +334,22 @@ echo "Installation completed!"
 echo "The application has been installed to: $INSTALL_DIR"
 echo "Desktop shortcut created."
 echo "Application menu entry created."
-"""
-        with open("install.sh", "w") as f:
-            f.write(installer_content)
-        # Make executable
-        os.chmod("install.sh", 0o755)
-        print("Created Linux installer script: install.sh")
+""",
+    },
+}
+
+
+def create_installer_scripts(platform_name, extension):
+    """Create the installer script for the current platform."""
+    template = INSTALLER_TEMPLATES.get(platform_name)
+    if template is None:
+        return
+
+    with open(template["filename"], "w") as f:
+        f.write(template["content"])
+    if template["executable"]:
+        os.chmod(template["filename"], 0o755)
+    print(f"Created {platform_name} installer script: {template['filename']}")
 
 
 def create_build_script(platform_name):
@@ -400,22 +449,22 @@ def main():
     print(f"Platform: {platform_name}")
     print("=" * 50)
 
-    # Install PyInstaller
-    if not install_pyinstaller():
-        print("Failed to install PyInstaller. Exiting.")
-        return 1
+    # The installer and build scripts only depend on the platform name,
+    # so generate them while the (potentially slow) pip install runs
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        pyinstaller_future = executor.submit(install_pyinstaller)
+        executor.submit(create_installer_scripts, platform_name, extension)
+        executor.submit(create_build_script, platform_name)
+
+        if not pyinstaller_future.result():
+            print("Failed to install PyInstaller. Exiting.")
+            return 1
 
     # Build executable
     if not build_executable(platform_name, extension):
         print("Failed to build executable. Exiting.")
         return 1
 
-    # Create installer scripts
-    create_installer_scripts(platform_name, extension)
-
-    # Create build script
-    create_build_script(platform_name)
-
     print(f"\nBuild completed successfully for {platform_name}!")
     print(f"Executable location: dist/Baresha-Downloader{'.exe' if platform_name == 'windows' else ''}")
 
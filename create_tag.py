@@ -4,28 +4,40 @@ Script to create and push tags manually when GitHub Actions fails.
 This is a fallback solution for tag creation issues.
 """
 
+import shlex
 import subprocess
 import sys
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+# Compiled once at import; these run on every CI invocation
+TAG_VERSION_RE = re.compile(r"v(\d+\.\d+\.\d+)")
+VERSION_RE = re.compile(r"^\d+\.\d+\.\d+$")
+
 
 def run_command(command, check=True):
-    """Run a shell command and return the result."""
+    """Run a command (argv list or string) and return the result."""
+    if isinstance(command, str):
+        command = shlex.split(command)
     try:
-        result = subprocess.run(command, shell=True, capture_output=True, text=True, check=check)
+        # No shell=True: exec git directly instead of paying for an extra
+        # shell process (and quoting/injection hazards) per call
+        result = subprocess.run(command, capture_output=True, text=True, check=check)
         return result.stdout.strip(), result.stderr.strip(), result.returncode
     except subprocess.CalledProcessError as e:
         return e.stdout.strip(), e.stderr.strip(), e.returncode
 
 
-def get_current_version():
+def get_current_version(describe_result=None):
     """Get the current version from the latest tag."""
-    stdout, stderr, returncode = run_command("git describe --tags --abbrev=0", check=False)
+    if describe_result is None:
+        describe_result = run_command(["git", "describe", "--tags", "--abbrev=0"], check=False)
+    stdout, stderr, returncode = describe_result
     if returncode == 0:
         # Extract version from tag like "v1.2.3"
-        match = re.search(r"v(\d+\.\d+\.\d+)", stdout)
+        match = TAG_VERSION_RE.search(stdout)
         if match:
             return match.group(1)
 
@@ -58,13 +70,13 @@ def create_tag(version, message=None):
     print(f"Message: {message}")
 
     # Create the tag
-    stdout, stderr, returncode = run_command(f'git tag -a "{tag_name}" -m "{message}"')
+    stdout, stderr, returncode = run_command(["git", "tag", "-a", tag_name, "-m", message])
     if returncode != 0:
         print(f"Error creating tag: {stderr}")
         return False
 
     # Push the tag
-    stdout, stderr, returncode = run_command(f'git push origin "{tag_name}"')
+    stdout, stderr, returncode = run_command(["git", "push", "origin", tag_name])
     if returncode != 0:
         print(f"Error pushing tag: {stderr}")
         print("\nTo push manually, run:")
@@ -90,22 +102,28 @@ def main():
     version_arg = sys.argv[1]
     message = sys.argv[2] if len(sys.argv) > 2 else None
 
+    # The repo sanity check and the version lookup are independent git
+    # calls - dispatch them together and pay only for the slower one
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        status_future = executor.submit(run_command, ["git", "status"], check=False)
+        describe_future = executor.submit(run_command, ["git", "describe", "--tags", "--abbrev=0"], check=False)
+
     # Check if we're in a git repository
-    stdout, stderr, returncode = run_command("git status", check=False)
+    stdout, stderr, returncode = status_future.result()
     if returncode != 0:
         print("Error: Not in a git repository")
         sys.exit(1)
 
     # Handle special version keywords
     if version_arg in ["patch", "minor", "major"]:
-        current_version = get_current_version()
+        current_version = get_current_version(describe_future.result())
         new_version = calculate_new_version(current_version, version_arg)
         print(f"Current version: {current_version}")
         print(f"New version: {new_version}")
         version = new_version
     else:
         # Validate version format
-        if not re.match(r"^\d+\.\d+\.\d+$", version_arg):
+        if not VERSION_RE.match(version_arg):
             print("Error: Version must be in format X.Y.Z (e.g., 0.1.0)")
             sys.exit(1)
         version = version_arg
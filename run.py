@@ -5,22 +5,19 @@ Simple launcher for the YouTube Video Downloader
 
 import sys
 import os
-import subprocess
 
 
 def check_dependencies():
     """Check if required dependencies are installed."""
-    try:
-        import yt_dlp
-        import requests
-        from PIL import Image
-        import tkinter
+    import importlib.util
 
-        return True
-    except ImportError as e:
-        print(f"Missing dependency: {e}")
-        print("Please install dependencies with: pip install -r requirements.txt")
-        return False
+    # find_spec resolves presence without importing the packages themselves
+    for module in ("yt_dlp", "requests", "PIL", "tkinter"):
+        if importlib.util.find_spec(module) is None:
+            print(f"Missing dependency: {module}")
+            print("Please install dependencies with: pip install -r requirements.txt")
+            return False
+    return True
 
 
 def main():
@@ -28,9 +25,13 @@ def main():
     print("YouTube Video Downloader")
     print("=" * 30)
 
-    # Check dependencies
-    if not check_dependencies():
-        return 1
+    # Check dependencies (after exec, signals go straight to the downloader)
+    try:
+        if not check_dependencies():
+            return 1
+    except KeyboardInterrupt:
+        print("\nOperation cancelled by user.")
+        return 0
 
     # Get the directory of this script
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -44,16 +45,17 @@ def main():
     # Pass all arguments to the main script
     args = [sys.executable, downloader_script] + sys.argv[1:]
 
-    try:
-        # Run the main script
-        result = subprocess.run(args, check=True)
-        return result.returncode
-    except subprocess.CalledProcessError as e:
-        print(f"Error running downloader: {e}")
-        return e.returncode
-    except KeyboardInterrupt:
-        print("\nOperation cancelled by user.")
-        return 0
+    if os.name == "nt":
+        # exec semantics differ on Windows; wait on a child instead.
+        # subprocess quotes the argv properly - the spawn family joins on
+        # spaces, which breaks paths like "Program Files"
+        import subprocess
+
+        return subprocess.run(args).returncode
+
+    # Replace this process with the downloader directly - no extra
+    # interpreter stays resident waiting on the child
+    os.execv(sys.executable, args)
 
 
 if __name__ == "__main__":
@@ -4,12 +4,47 @@ Test script for the automatic release system.
 This script helps you understand how conventional commits work.
 """
 
-import re
 import sys
-from typing import Dict, List, Tuple
-
-
-def parse_commit_message(message: str) -> Dict:
+from typing import Iterable, List, NamedTuple, Optional
+
+# Recognized conventional-commit types and the version bump each implies
+COMMIT_TYPES = frozenset({"feat", "fix", "docs", "style", "refactor", "test", "chore", "ci", "build", "perf", "revert"})
+BUMP_BY_TYPE = {
+    "feat": "minor",
+    "fix": "patch",
+    "docs": "none",
+    "style": "none",
+    "refactor": "none",
+    "test": "none",
+    "chore": "none",
+    "ci": "none",
+    "build": "none",
+    "perf": "none",
+    "revert": "patch",
+}
+
+# How each bump type rewrites a parsed (major, minor, patch) tuple
+BUMP_EXAMPLES = {
+    "major": lambda major, minor, patch: f"{major + 1}.0.0",
+    "minor": lambda major, minor, patch: f"{major}.{minor + 1}.0",
+    "patch": lambda major, minor, patch: f"{major}.{minor}.{patch + 1}",
+}
+
+
+class CommitInfo(NamedTuple):
+    """Parsed components of a conventional commit message."""
+
+    valid: bool
+    type: Optional[str] = None
+    scope: Optional[str] = None
+    description: Optional[str] = None
+    breaking: bool = False
+    bump_type: str = "none"
+    message: str = ""
+    error: Optional[str] = None
+
+
+def parse_commit_message(message: str) -> CommitInfo:
     """
     Parse a conventional commit message and return its components.
 
@@ -17,40 +52,76 @@ def parse_commit_message(message: str) -> Dict:
         message: The commit message to parse
 
     Returns:
-        Dictionary with parsed components
+        CommitInfo with parsed components
+    """
+    invalid = CommitInfo(valid=False, message=message, error="Does not follow conventional commit format")
+
+    # Parse the "<type>[(scope)][!]: <description>" header with string
+    # slicing and a set lookup instead of walking a regex alternation
+    colon = message.find(":")
+    if colon == -1:
+        return invalid
+
+    head = message[:colon]
+    rest = message[colon + 1 :]
+
+    # The description starts after at least one whitespace character and
+    # must be a single non-empty line (a lone trailing newline is fine)
+    description = rest.lstrip()
+    if len(description) == len(rest):
+        return invalid
+    if description.endswith("\n"):
+        description = description[:-1]
+    if not description or "\n" in description:
+        return invalid
+
+    breaking_mark = head.endswith("!")
+    if breaking_mark:
+        head = head[:-1]
+
+    scope = None
+    paren = head.find("(")
+    if paren != -1:
+        if not head.endswith(")"):
+            return invalid
+        scope = head[paren + 1 : -1]
+        if not scope or ")" in scope:
+            return invalid
+        head = head[:paren]
+
+    if head not in COMMIT_TYPES:
+        return invalid
+
+    # Check for breaking change in the body only - a single bounded scan
+    # that short-circuits for the common case of a header-only message
+    newline = message.find("\n")
+    breaking_change = newline != -1 and message.find("BREAKING CHANGE:", newline) != -1
+
+    breaking = breaking_mark or breaking_change
+    bump_type = "major" if breaking else BUMP_BY_TYPE.get(head, "none")
+
+    return CommitInfo(
+        valid=True,
+        type=head,
+        scope=scope,
+        description=description,
+        breaking=breaking,
+        bump_type=bump_type,
+        message=message,
+    )
+
+
+def parse_many(messages: Iterable[str]) -> List[CommitInfo]:
+    """
+    Parse a batch of commit messages.
+
+    Args:
+        messages: The commit messages to parse
+
+    Returns:
+        List of CommitInfo, one per message
     """
-    # Conventional commit pattern
-    pattern = r"^(?P<type>feat|fix|docs|style|refactor|test|chore|ci|build|perf|revert)(?:\((?P<scope>[^)]+)\))?(?P<breaking>!)?:\s+(?P<description>.+)$"
-
-    match = re.match(pattern, message)
-    if not match:
-        return {"valid": False, "error": "Does not follow conventional commit format"}
-
-    groups = match.groupdict()
-
-    # Check for breaking change in body
-    breaking_change = "BREAKING CHANGE:" in message
-
-    # Determine version bump type
-    bump_type = "none"
-    if groups["type"] == "feat" and not groups["breaking"] and not breaking_change:
-        bump_type = "minor"
-    elif groups["type"] == "fix" and not groups["breaking"] and not breaking_change:
-        bump_type = "patch"
-    elif groups["breaking"] or breaking_change:
-        bump_type = "major"
-    elif groups["type"] in ["docs", "style", "refactor", "test", "chore", "ci", "build", "perf"]:
-        bump_type = "none"
-
-    return {
-        "valid": True,
-        "type": groups["type"],
-        "scope": groups["scope"],
-        "description": groups["description"],
-        "breaking": bool(groups["breaking"] or breaking_change),
-        "bump_type": bump_type,
-        "message": message,
-    }
+    return [parse_commit_message(message) for message in messages]
 
 
 def get_version_bump_example(current_version: str, bump_type: str) -> str:
@@ -67,57 +138,48 @@ def get_version_bump_example(current_version: str, bump_type: str) -> str:
     if bump_type == "none":
         return f"{current_version} (no change)"
 
-    parts = current_version.split(".")
-    major, minor, patch = int(parts[0]), int(parts[1]), int(parts[2])
-
-    if bump_type == "major":
-        return f"{major + 1}.0.0"
-    elif bump_type == "minor":
-        return f"{major}.{minor + 1}.0"
-    elif bump_type == "patch":
-        return f"{major}.{minor}.{patch + 1}"
-
-    return current_version
-
-
-def test_commit_messages() -> List[Dict]:
+    bump = BUMP_EXAMPLES.get(bump_type)
+    if bump is None:
+        return current_version
+
+    major, minor, patch = map(int, current_version.split("."))
+    return bump(major, minor, patch)
+
+
+_TEST_MESSAGES = (
+    "feat: add playlist download support",
+    "fix: resolve memory leak in batch downloads",
+    "docs: update installation instructions",
+    "style: format code according to style guide",
+    "refactor: improve error handling in download engine",
+    "test: add unit tests for video info extraction",
+    "chore: update dependencies",
+    "ci: add automated testing workflow",
+    "build: update build configuration",
+    "perf: optimize video processing algorithm",
+    "revert: revert to previous download method",
+    "feat(ui): add dark mode toggle",
+    "fix(download): resolve resume issue for large files",
+    "feat!: completely redesign application architecture",
+    "feat: add new download format\n\nBREAKING CHANGE: API has changed significantly",
+    "just some random commit message",
+    "updated stuff",
+    "fixed bug",
+    "new feature",
+)
+
+
+def test_commit_messages() -> List[CommitInfo]:
     """
     Test various commit message examples.
 
     Returns:
         List of test results
     """
-    test_messages = [
-        "feat: add playlist download support",
-        "fix: resolve memory leak in batch downloads",
-        "docs: update installation instructions",
-        "style: format code according to style guide",
-        "refactor: improve error handling in download engine",
-        "test: add unit tests for video info extraction",
-        "chore: update dependencies",
-        "ci: add automated testing workflow",
-        "build: update build configuration",
-        "perf: optimize video processing algorithm",
-        "revert: revert to previous download method",
-        "feat(ui): add dark mode toggle",
-        "fix(download): resolve resume issue for large files",
-        "feat!: completely redesign application architecture",
-        "feat: add new download format\n\nBREAKING CHANGE: API has changed significantly",
-        "just some random commit message",
-        "updated stuff",
-        "fixed bug",
-        "new feature",
-    ]
-
-    results = []
-    for message in test_messages:
-        result = parse_commit_message(message)
-        results.append(result)
+    return parse_many(_TEST_MESSAGES)
 
-    return results
 
-
-def print_results(results: List[Dict], current_version: str = "1.0.0"):
+def print_results(results: List[CommitInfo], current_version: str = "1.0.0"):
     """
     Print formatted results of commit message analysis.
 
@@ -125,18 +187,21 @@ def print_results(results: List[Dict], current_version: str = "1.0.0"):
         results: List of parsed commit messages
         current_version: Current version to use in examples
     """
-    print("🚀 Conventional Commit Message Tester")
-    print("=" * 50)
-    print()
-
-    print("📋 Test Results:")
-    print("-" * 50)
+    # Buffer everything and emit a single write instead of ~10 print
+    # calls (each a separate stdout lock + syscall) per entry
+    lines = [
+        "🚀 Conventional Commit Message Tester",
+        "=" * 50,
+        "",
+        "📋 Test Results:",
+        "-" * 50,
+    ]
 
     for i, result in enumerate(results, 1):
-        print(f"\n{i:2d}. {result['message']}")
+        lines.append(f"\n{i:2d}. {result.message}")
 
-        if result["valid"]:
-            bump_type = result["bump_type"]
+        if result.valid:
+            bump_type = result.bump_type
             new_version = get_version_bump_example(current_version, bump_type)
 
             status = "✅ VALID"
@@ -149,61 +214,72 @@ def print_results(results: List[Dict], current_version: str = "1.0.0"):
             else:
                 status += " (NO RELEASE)"
 
-            print(f"    {status}")
-            print(f"    Type: {result['type']}")
-            if result["scope"]:
-                print(f"    Scope: {result['scope']}")
-            print(f"    Description: {result['description']}")
-            print(f"    Breaking Change: {'Yes' if result['breaking'] else 'No'}")
-            print(f"    Version: {current_version} → {new_version}")
+            lines.append(f"    {status}")
+            lines.append(f"    Type: {result.type}")
+            if result.scope:
+                lines.append(f"    Scope: {result.scope}")
+            lines.append(f"    Description: {result.description}")
+            lines.append(f"    Breaking Change: {'Yes' if result.breaking else 'No'}")
+            lines.append(f"    Version: {current_version} → {new_version}")
         else:
-            print(f"    ❌ INVALID: {result['error']}")
-            print(f"    Version: {current_version} (no change)")
+            lines.append(f"    ❌ INVALID: {result.error}")
+            lines.append(f"    Version: {current_version} (no change)")
+
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+# The guide text never changes, so assemble it once at import time and
+# emit it with a single write instead of ~35 print calls
+_USAGE_GUIDE = f"""
+📚 Conventional Commit Guide:
+{'=' * 50}
+
+🎯 Format:
+   <type>(<scope>): <description>
+
+   [optional body]
+
+   [optional footer(s)]
+
+📝 Types that trigger releases:
+   feat:     New feature (minor version bump)
+   fix:      Bug fix (patch version bump)
+   BREAKING CHANGE: Breaking change (major version bump)
+   revert:   Revert previous commit (patch version bump)
+
+📝 Types that don't trigger releases:
+   docs:     Documentation changes
+   style:    Code style changes
+   refactor: Code refactoring
+   test:     Adding or updating tests
+   chore:    Maintenance tasks
+   ci:       CI/CD changes
+   build:    Build system changes
+   perf:     Performance improvements
+
+💡 Examples:
+   feat: add playlist download support
+   fix: resolve download resume issue
+   feat(ui): add dark mode toggle
+   fix(download): resolve memory leak
+   feat!: completely redesign UI
+   feat: add new API
+
+BREAKING CHANGE: API has changed
+
+🚀 How to use:
+   1. Write your commit message in conventional format
+   2. Push to main/master branch
+   3. GitHub Actions will automatically create a release
+   4. Or manually create a tag: git tag -a v1.1.0 -m 'Release v1.1.0'
+"""
 
 
 def print_usage_guide():
     """
     Print usage guide for conventional commits.
     """
-    print("\n📚 Conventional Commit Guide:")
-    print("=" * 50)
-
-    print("\n🎯 Format:")
-    print("   <type>(<scope>): <description>")
-    print()
-    print("   [optional body]")
-    print()
-    print("   [optional footer(s)]")
-
-    print("\n📝 Types that trigger releases:")
-    print("   feat:     New feature (minor version bump)")
-    print("   fix:      Bug fix (patch version bump)")
-    print("   BREAKING CHANGE: Breaking change (major version bump)")
-    print("   revert:   Revert previous commit (patch version bump)")
-
-    print("\n📝 Types that don't trigger releases:")
-    print("   docs:     Documentation changes")
-    print("   style:    Code style changes")
-    print("   refactor: Code refactoring")
-    print("   test:     Adding or updating tests")
-    print("   chore:    Maintenance tasks")
-    print("   ci:       CI/CD changes")
-    print("   build:    Build system changes")
-    print("   perf:     Performance improvements")
-
-    print("\n💡 Examples:")
-    print("   feat: add playlist download support")
-    print("   fix: resolve download resume issue")
-    print("   feat(ui): add dark mode toggle")
-    print("   fix(download): resolve memory leak")
-    print("   feat!: completely redesign UI")
-    print("   feat: add new API\n\nBREAKING CHANGE: API has changed")
-
-    print("\n🚀 How to use:")
-    print("   1. Write your commit message in conventional format")
-    print("   2. Push to main/master branch")
-    print("   3. GitHub Actions will automatically create a release")
-    print("   4. Or manually create a tag: git tag -a v1.1.0 -m 'Release v1.1.0'")
+    sys.stdout.write(_USAGE_GUIDE)
 
 
 def main():
@@ -222,8 +298,8 @@ def main():
         print(f"Testing: {message}")
         print("-" * 50)
 
-        if result["valid"]:
-            bump_type = result["bump_type"]
+        if result.valid:
+            bump_type = result.bump_type
             new_version = get_version_bump_example(current_version, bump_type)
 
             status = "✅ VALID"
@@ -237,15 +313,15 @@ def main():
                 status += " (NO RELEASE)"
 
             print(f"Status: {status}")
-            print(f"Type: {result['type']}")
-            if result["scope"]:
-                print(f"Scope: {result['scope']}")
-            print(f"Description: {result['description']}")
-            print(f"Breaking Change: {'Yes' if result['breaking'] else 'No'}")
+            print(f"Type: {result.type}")
+            if result.scope:
+                print(f"Scope: {result.scope}")
+            print(f"Description: {result.description}")
+            print(f"Breaking Change: {'Yes' if result.breaking else 'No'}")
             print(f"Version: {current_version} → {new_version}")
         else:
             print(f"Status: ❌ INVALID")
-            print(f"Error: {result['error']}")
+            print(f"Error: {result.error}")
             print(f"Version: {current_version} (no change)")
 
         print_usage_guide()
@@ -12,59 +12,86 @@ Features:
 - System theme detection and dark/light mode support
 """
 
+import hashlib
+import io
 import os
 import sys
 import threading
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
-import yt_dlp
-import requests
-from PIL import Image, ImageTk
-import urllib.request
-from urllib.parse import urlparse
 import re
+import shutil
 import subprocess
 from pathlib import Path
 import json
+import atexit
+import queue
 import datetime
-from collections import defaultdict
+from collections import defaultdict, deque, OrderedDict
 import time
-import pystray
-from pystray import MenuItem as item
 
-# Import Sun Valley theme
-try:
-    import sv_ttk
+# yt_dlp parses every extractor module at import time (easily a second
+# of startup); defer it to the first call that needs it. requests and
+# PIL are likewise imported where they are first used.
+_yt_dlp = None
 
-    SUN_VALLEY_AVAILABLE = True
-except ImportError:
-    SUN_VALLEY_AVAILABLE = False
-    print("Warning: Sun Valley theme not available. Using default theme.")
 
-# Import darkdetect for system theme detection
-try:
-    import darkdetect
+def _load_yt_dlp():
+    """Import yt_dlp on first use and cache the module."""
+    global _yt_dlp
+    if _yt_dlp is None:
+        import yt_dlp
 
-    DARKDETECT_AVAILABLE = True
-except ImportError:
-    DARKDETECT_AVAILABLE = False
+        _yt_dlp = yt_dlp
+    return _yt_dlp
 
-# Try to import plyer for notifications
-try:
-    from plyer import notification
 
-    PLYER_AVAILABLE = True
-except ImportError:
-    PLYER_AVAILABLE = False
+# Workers for thumbnail fetch + decode; PhotoImage construction still
+# happens on the Tk main thread (see _install_thumbnail)
+THUMB_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 2)
+
+# Resolve the install directory and the files living in it once; these
+# paths are rebuilt on every settings save and history flush otherwise
+_MODULE_DIR = Path(__file__).resolve().parent
+_SETTINGS_PATH = _MODULE_DIR / "settings.json"
+_HISTORY_PATH = _MODULE_DIR / "download_history.json"
+_HISTORY_LOG_PATH = _MODULE_DIR / "download_history.jsonl"
+_LOGO_PATH = _MODULE_DIR / "baresha-logo.jpg"
 
-# Try to import pystray for system tray
+# orjson serializes and parses JSON in C, several times faster than the
+# stdlib; history and settings I/O fall back to json when it is absent
 try:
-    import pystray
-    from pystray import MenuItem as item
+    import orjson
 
-    PYSTRAY_AVAILABLE = True
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _json_dump_line = orjson.dumps
+    _json_loads = orjson.loads
 except ImportError:
-    PYSTRAY_AVAILABLE = False
+
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2).encode()
+
+    def _json_dump_line(obj):
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads
+
+
+# Probe for the Sun Valley theme without importing it; setup_theme
+# imports it when a themed window is actually built
+SUN_VALLEY_AVAILABLE = importlib.util.find_spec("sv_ttk") is not None
+if not SUN_VALLEY_AVAILABLE:
+    print("Warning: Sun Valley theme not available. Using default theme.")
+
+# Probe the remaining optional modules the same way; each is imported
+# at its single call site so startup never pays for unused features
+DARKDETECT_AVAILABLE = importlib.util.find_spec("darkdetect") is not None
+PLYER_AVAILABLE = importlib.util.find_spec("plyer") is not None
+PYSTRAY_AVAILABLE = importlib.util.find_spec("pystray") is not None
 
 
 # Add a simple tooltip helper class
@@ -104,13 +131,25 @@ class ToolTip:
 
 
 class YouTubeDownloader:
+    # Formats handled by extracting the audio stream and re-encoding
+    _AUDIO_CODECS = frozenset({"mp3", "m4a", "aac"})
+    # yt-dlp format selector per quality cap
+    _QUALITY_FORMAT = {
+        f"{height}p": f"bestvideo[height<={height}][ext=mp4]+bestaudio[ext=m4a]/best[height<={height}]/best"
+        for height in (2160, 1440, 1080, 720, 480, 360)
+    }
+    # Audio-extraction postprocessor template; preferredcodec is filled in
+    # per download
+    _AUDIO_POSTPROC = {"key": "FFmpegExtractAudio", "preferredquality": "192"}
+
     def __init__(self):
         self.download_path = os.path.expanduser("~/Downloads")
         self.current_download = None
         self.download_thread = None
+        # Settings load first so find_ffmpeg can use its cached result
+        self.settings = self.load_settings()
         self.ffmpeg_path = self.find_ffmpeg()
         self.download_history = self.load_download_history()
-        self.settings = self.load_settings()
 
         # Quality presets
         self.quality_presets = {
@@ -134,44 +173,137 @@ class YouTubeDownloader:
         }
         # Download speed limit (bytes/sec), 0 means unlimited
         self.speed_limit = self.settings.get("speed_limit", 0)
+        # How many videos a batch downloads at once
+        self.max_parallel_downloads = self.settings.get("max_parallel_downloads", 3)
+        # Per-session cache of format listings keyed by URL
+        self._formats_cache = {}
+        # Raw yt-dlp info dicts keyed by URL as (monotonic time, info),
+        # reused at download time while younger than _INFO_TTL
+        self._info_cache = {}
+        # Shelve-backed copy of the info cache so a restart within the
+        # TTL still skips the metadata round trip; opened on first use.
+        # dbm files tolerate neither concurrent writers nor a second
+        # handle, so every access happens under this lock
+        self._info_disk = None
+        self._info_disk_lock = threading.Lock()
+        # Shared HTTP session, created on first use (see get_http_session)
+        self._http = None
+        # History entries buffered for the debounced background flush
+        self._pending_history = []
+        self._history_lock = threading.Lock()
+        self._history_timer = None
+        # Persistent yt-dlp cache (player JS, signature functions) so
+        # repeated runs skip re-fetching and re-solving decipher code
+        self.cache_dir = str(_MODULE_DIR / ".ytdlp_cache")
+        # Fold the append log back into download_history.json on exit
+        atexit.register(self.save_download_history)
+
+    def get_http_session(self):
+        """Shared requests.Session so repeated fetches reuse connections.
+
+        Thumbnails all come from the same host; keep-alive avoids a new
+        TCP+TLS handshake per image during batch fetches.
+        """
+        if self._http is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            session.headers["User-Agent"] = f"Baresha-Downloader/{APP_VERSION}"
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._http = session
+        return self._http
+
+    def _base_ydl_opts(self):
+        """Common yt-dlp options shared by info, format and download calls."""
+        ydl_opts = {
+            "quiet": True,
+            "no_warnings": True,
+            "cachedir": self.cache_dir,
+        }
+        if self.ffmpeg_path:
+            ydl_opts["ffmpeg_location"] = self.ffmpeg_path
+        return ydl_opts
 
-    def find_ffmpeg(self):
+    def find_ffmpeg(self, use_cache=True):
         """Find FFmpeg installation."""
-        # Check if FFmpeg is in PATH
-        try:
-            result = subprocess.run(["ffmpeg", "-version"], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                return "ffmpeg"
-        except:
-            pass
-
-        # Check if FFmpeg is in project directory
-        project_dir = Path(__file__).parent
-        ffmpeg_dir = project_dir / "ffmpeg"
-        ffmpeg_exe = ffmpeg_dir / "ffmpeg.exe"
-
-        if ffmpeg_exe.exists():
-            return str(ffmpeg_exe)
+        # A cached path whose mtime still matches skips all detection;
+        # the old code forked "ffmpeg -version" on every startup
+        if use_cache:
+            cached = self.settings.get("ffmpeg_path")
+            if cached:
+                try:
+                    if os.stat(cached).st_mtime == self.settings.get("ffmpeg_mtime"):
+                        return cached
+                except OSError:
+                    pass
+
+        # which() walks PATH in-process instead of launching the binary
+        ffmpeg = shutil.which("ffmpeg")
+
+        if not ffmpeg:
+            # Check if FFmpeg is in project directory
+            binary = "ffmpeg.exe" if os.name == "nt" else "ffmpeg"
+            ffmpeg_exe = _MODULE_DIR / "ffmpeg" / binary
+            if ffmpeg_exe.exists():
+                ffmpeg = str(ffmpeg_exe)
+
+        if ffmpeg:
+            try:
+                self.settings["ffmpeg_path"] = ffmpeg
+                self.settings["ffmpeg_mtime"] = os.stat(ffmpeg).st_mtime
+                self.save_settings()
+            except OSError:
+                pass
 
-        return None
+        return ffmpeg
 
     def load_download_history(self):
         """Load download history from file."""
-        history_file = Path(__file__).parent / "download_history.json"
+        history = []
+        history_file = _HISTORY_PATH
         try:
             if history_file.exists():
-                with open(history_file, "r") as f:
-                    return json.load(f)
+                with open(history_file, "rb") as f:
+                    history = _json_loads(f.read())
         except:
             pass
-        return []
+        # Entries appended since the last consolidation live in the .jsonl
+        log_file = _HISTORY_LOG_PATH
+        try:
+            if log_file.exists():
+                with open(log_file, "rb") as f:
+                    for line in f:
+                        line = line.strip()
+                        if line:
+                            history.append(_json_loads(line))
+        except:
+            pass
+        return history
 
     def save_download_history(self):
-        """Save download history to file."""
-        history_file = Path(__file__).parent / "download_history.json"
+        """Consolidate the full download history to file."""
+        # download_history already holds any buffered entries; drop the
+        # pending flush so it cannot resurrect them after consolidation
+        with self._history_lock:
+            self._pending_history = []
+            if self._history_timer is not None:
+                self._history_timer.cancel()
+                self._history_timer = None
+        history_file = _HISTORY_PATH
+        log_file = _HISTORY_LOG_PATH
         try:
-            with open(history_file, "w") as f:
-                json.dump(self.download_history, f, indent=2)
+            # Write to a sibling temp file and os.replace it into place so
+            # a crash mid-write never truncates the existing history
+            tmp_file = history_file.with_suffix(".json.tmp")
+            with open(tmp_file, "wb") as f:
+                f.write(_json_dumps(self._public_entries(self.download_history)))
+            os.replace(tmp_file, history_file)
+            # The appended entries are now part of the consolidated file
+            if log_file.exists():
+                log_file.unlink()
         except:
             pass
 
@@ -186,111 +318,226 @@ class YouTubeDownloader:
             "timestamp": datetime.datetime.now().isoformat(),
         }
         self.download_history.append(entry)
-        self.save_download_history()
+        # Buffer the write and flush shortly after; a batch of downloads
+        # finishing together coalesces into one disk write, and the
+        # completion handler returns without touching the filesystem
+        with self._history_lock:
+            self._pending_history.append(entry)
+            if self._history_timer is None:
+                self._history_timer = threading.Timer(0.5, self._flush_history)
+                self._history_timer.daemon = True
+                self._history_timer.start()
+
+    def _flush_history(self):
+        """Append buffered history entries to the log in one write."""
+        with self._history_lock:
+            pending, self._pending_history = self._pending_history, []
+            self._history_timer = None
+        if not pending:
+            return
+        log_file = _HISTORY_LOG_PATH
+        try:
+            with open(log_file, "ab") as f:
+                f.write(b"".join(_json_dump_line(entry) + b"\n" for entry in self._public_entries(pending)))
+        except:
+            pass
+
+    @staticmethod
+    def _public_entries(entries):
+        """Copy entries without the derived cache fields (underscore keys)."""
+        return [{k: v for k, v in entry.items() if not k.startswith("_")} for entry in entries]
 
     def get_video_info(self, url):
         """Extract video information from YouTube URL."""
         try:
-            ydl_opts = {
-                "quiet": True,
-                "no_warnings": True,
-                "extract_flat": True,
-            }
-
-            # Add FFmpeg path if available
-            if self.ffmpeg_path:
-                ydl_opts["ffmpeg_location"] = self.ffmpeg_path
+            yt_dlp = _load_yt_dlp()
+            ydl_opts = self._base_ydl_opts()
+            ydl_opts["extract_flat"] = True
 
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 info = ydl.extract_info(url, download=False)
-                return {
-                    "title": info.get("title", "Unknown"),
-                    "duration": info.get("duration", 0),
-                    "thumbnail": info.get("thumbnail", ""),
-                    "formats": info.get("formats", []),
-                    "webpage_url": info.get("webpage_url", url),
-                    "uploader": info.get("uploader", "Unknown"),
-                    "view_count": info.get("view_count", 0),
-                    "like_count": info.get("like_count", 0),
-                    "upload_date": info.get("upload_date", ""),
-                    "description": info.get("description", "")[:200] + "..." if info.get("description", "") else "",
-                }
+                self._cache_info(url, info)
+                return self._summarize_info(info, url)
         except Exception as e:
             raise Exception(f"Error extracting video info: {str(e)}")
 
-    def download_video(self, url, output_path, quality="best", format_type="mp4", progress_callback=None):
-        """Download video with specified quality and format. Supports resume."""
+    def get_video_info_many(self, urls, max_workers=8):
+        """Extract video information for several URLs concurrently.
+
+        Fans extraction out across a thread pool - the work is
+        network-latency bound, so concurrent requests overlap instead of
+        serializing round-trips. Each worker builds its own YoutubeDL
+        (the class is not thread-safe); the shared persistent cachedir
+        still lets them reuse the solved player JS.
+
+        Returns a list of (url, info, error) tuples in input order;
+        exactly one of info/error is None per entry.
+        """
+        yt_dlp = _load_yt_dlp()
+        ydl_opts = self._base_ydl_opts()
+        ydl_opts["extract_flat"] = True
+
+        def extract(url):
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                return ydl.extract_info(url, download=False)
+
+        results = []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+            futures = [executor.submit(extract, url) for url in urls]
+            for url, future in zip(urls, futures):
+                try:
+                    info = future.result()
+                    self._cache_info(url, info)
+                    results.append((url, self._summarize_info(info, url), None))
+                except Exception as e:
+                    results.append((url, None, str(e)))
+        return results
+
+    # How long a cached info dict stays usable; signed stream URLs in the
+    # dict expire server-side after roughly this window
+    _INFO_TTL = 6 * 60 * 60
+
+    def _info_shelf(self):
+        """Open (once) the on-disk info cache; None when unavailable.
+
+        Callers must hold _info_disk_lock for the open and for every
+        read/write on the returned shelf.
+        """
+        if self._info_disk is None:
+            try:
+                import shelve
+
+                self._info_disk = shelve.open(str(_MODULE_DIR / ".ytinfo_cache"))
+                atexit.register(self._info_disk.close)
+            except:
+                self._info_disk = False
+        return self._info_disk or None
+
+    def _cache_info(self, url, info):
+        """Keep the raw info dict so a later download skips re-extraction."""
+        entry = (time.monotonic(), info)
+        self._info_cache[url] = entry
+        webpage_url = info.get("webpage_url")
+        if webpage_url:
+            self._info_cache[webpage_url] = entry
+        with self._info_disk_lock:
+            shelf = self._info_shelf()
+            if shelf is not None:
+                try:
+                    record = {"t": time.time(), "info": info}
+                    shelf[hashlib.sha256(url.encode()).hexdigest()] = record
+                    if webpage_url:
+                        shelf[hashlib.sha256(webpage_url.encode()).hexdigest()] = record
+                except:
+                    pass
+
+    def _invalidate_info(self, url, info=None):
+        """Drop a cached info dict from memory and the disk shelf."""
+        keys = [url]
+        if info:
+            webpage_url = info.get("webpage_url")
+            if webpage_url and webpage_url != url:
+                keys.append(webpage_url)
+        for key in keys:
+            self._info_cache.pop(key, None)
+        with self._info_disk_lock:
+            shelf = self._info_shelf()
+            if shelf is not None:
+                for key in keys:
+                    try:
+                        del shelf[hashlib.sha256(key.encode()).hexdigest()]
+                    except:
+                        pass
+
+    def _cached_info(self, url):
+        """Return the cached info dict for a URL, or None if missing/stale."""
+        entry = self._info_cache.get(url)
+        if entry is not None:
+            cached_at, info = entry
+            if time.monotonic() - cached_at <= self._INFO_TTL:
+                return info
+            del self._info_cache[url]
+
+        # Fall back to the previous run's cache; promote fresh hits to
+        # memory and evict anything past the TTL
+        with self._info_disk_lock:
+            shelf = self._info_shelf()
+            if shelf is not None:
+                key = hashlib.sha256(url.encode()).hexdigest()
+                try:
+                    record = shelf.get(key)
+                    if record is not None:
+                        if time.time() - record["t"] <= self._INFO_TTL:
+                            self._info_cache[url] = (time.monotonic(), record["info"])
+                            return record["info"]
+                        del shelf[key]
+                except:
+                    pass
+        return None
+
+    def _summarize_info(self, info, url):
+        """Reduce a yt-dlp info dict to the fields the app uses."""
+        return {
+            "title": info.get("title", "Unknown"),
+            "duration": info.get("duration", 0),
+            "thumbnail": info.get("thumbnail", ""),
+            "formats": info.get("formats", []),
+            "webpage_url": info.get("webpage_url", url),
+            "uploader": info.get("uploader", "Unknown"),
+            "view_count": info.get("view_count", 0),
+            "like_count": info.get("like_count", 0),
+            "upload_date": info.get("upload_date", ""),
+            "description": info.get("description", "")[:200] + "..." if info.get("description", "") else "",
+        }
+
+    def download_video(self, url, output_path, quality="best", format_type="mp4", progress_callback=None, info=None):
+        """Download video with specified quality and format. Supports resume.
+
+        Pass an already-extracted info dict via `info` to skip the metadata
+        round trip entirely; otherwise the session cache is consulted.
+        """
         try:
+            yt_dlp = _load_yt_dlp()
+            ydl_opts = {
+                "outtmpl": os.path.join(output_path, "%(title)s.%(ext)s"),
+                "progress_hooks": [progress_callback] if progress_callback else [],
+            }
+
             # Configure format based on type
-            if format_type == "mp3":
-                ydl_opts = {
-                    "outtmpl": os.path.join(output_path, "%(title)s.%(ext)s"),
-                    "progress_hooks": [progress_callback] if progress_callback else [],
-                    "format": "bestaudio/best",
-                    "postprocessors": [
-                        {
-                            "key": "FFmpegExtractAudio",
-                            "preferredcodec": "mp3",
-                            "preferredquality": "192",
-                        }
-                    ],
-                }
-            elif format_type == "m4a":
-                ydl_opts = {
-                    "outtmpl": os.path.join(output_path, "%(title)s.%(ext)s"),
-                    "progress_hooks": [progress_callback] if progress_callback else [],
-                    "format": "bestaudio/best",
-                    "postprocessors": [
-                        {
-                            "key": "FFmpegExtractAudio",
-                            "preferredcodec": "m4a",
-                            "preferredquality": "192",
-                        }
-                    ],
-                }
-            elif format_type == "aac":
-                ydl_opts = {
-                    "outtmpl": os.path.join(output_path, "%(title)s.%(ext)s"),
-                    "progress_hooks": [progress_callback] if progress_callback else [],
-                    "format": "bestaudio/best",
-                    "postprocessors": [
-                        {
-                            "key": "FFmpegExtractAudio",
-                            "preferredcodec": "aac",
-                            "preferredquality": "192",
-                        }
-                    ],
-                }
+            if format_type in self._AUDIO_CODECS:
+                ydl_opts["format"] = "bestaudio/best"
+                ydl_opts["postprocessors"] = [dict(self._AUDIO_POSTPROC, preferredcodec=format_type)]
             else:
                 # Video formats - use proper quality selection
-                ydl_opts = {
-                    "outtmpl": os.path.join(output_path, "%(title)s.%(ext)s"),
-                    "progress_hooks": [progress_callback] if progress_callback else [],
-                }
-
-                if quality == "2160p":
-                    ydl_opts["format"] = "bestvideo[height<=2160][ext=mp4]+bestaudio[ext=m4a]/best[height<=2160]/best"
-                elif quality == "1440p":
-                    ydl_opts["format"] = "bestvideo[height<=1440][ext=mp4]+bestaudio[ext=m4a]/best[height<=1440]/best"
-                elif quality == "1080p":
-                    ydl_opts["format"] = "bestvideo[height<=1080][ext=mp4]+bestaudio[ext=m4a]/best[height<=1080]/best"
-                elif quality == "720p":
-                    ydl_opts["format"] = "bestvideo[height<=720][ext=mp4]+bestaudio[ext=m4a]/best[height<=720]/best"
-                elif quality == "480p":
-                    ydl_opts["format"] = "bestvideo[height<=480][ext=mp4]+bestaudio[ext=m4a]/best[height<=480]/best"
-                elif quality == "360p":
-                    ydl_opts["format"] = "bestvideo[height<=360][ext=mp4]+bestaudio[ext=m4a]/best[height<=360]/best"
-                else:
-                    ydl_opts["format"] = "best"
+                ydl_opts["format"] = self._QUALITY_FORMAT.get(quality, "best")
+            # Parallel fragment fetches keep DASH/HLS downloads from
+            # serializing many small requests; larger chunks cut per-range
+            # HTTP overhead on direct streams
+            ydl_opts["concurrent_fragment_downloads"] = self.settings.get("concurrent_fragments", 8)
+            ydl_opts["http_chunk_size"] = 10 * 1024 * 1024
+            # Shared options (cachedir, ffmpeg location, quiet)
+            ydl_opts.update(self._base_ydl_opts())
             # Add speed limit if set
             if self.speed_limit and self.speed_limit > 0:
                 ydl_opts["ratelimit"] = self.speed_limit
-            # Add FFmpeg path if available
-            if self.ffmpeg_path:
-                ydl_opts["ffmpeg_location"] = self.ffmpeg_path
             # Enable resume
             ydl_opts["continuedl"] = True
             ydl_opts["noprogress"] = False
+            cached_info = info if info is not None else self._cached_info(url)
+            if cached_info is not None:
+                try:
+                    # Feed the already-extracted metadata straight into
+                    # format selection and download, skipping the second
+                    # webpage + player JS fetch; copy because processing
+                    # mutates the dict
+                    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                        ydl.process_ie_result(dict(cached_info), download=True)
+                    return
+                except Exception:
+                    # Signed format URLs can die before the TTL (network
+                    # change, server-side invalidation); drop the stale
+                    # entry and fall through to a fresh extraction
+                    self._invalidate_info(url, cached_info)
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 ydl.download([url])
         except Exception as e:
@@ -298,42 +545,48 @@ class YouTubeDownloader:
 
     def get_available_formats(self, url):
         """Get available video formats with detailed information."""
-        try:
-            ydl_opts = {
-                "quiet": True,
-                "no_warnings": True,
-            }
-
-            # Add FFmpeg path if available
-            if self.ffmpeg_path:
-                ydl_opts["ffmpeg_location"] = self.ffmpeg_path
+        # Format listings are stable for a session, so reuse the result of
+        # the first extraction instead of re-fetching per call
+        cached = self._formats_cache.get(url)
+        if cached is not None:
+            return cached
 
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = yt_dlp.YoutubeDL(ydl_opts).extract_info(url, download=False)
-                formats = []
-
-                for f in info.get("formats", []):
-                    if f.get("height") and f.get("ext"):
-                        format_info = {
-                            "format_id": f.get("format_id", ""),
-                            "height": f.get("height", 0),
-                            "width": f.get("width", 0),
-                            "ext": f.get("ext", ""),
-                            "filesize": f.get("filesize", 0),
-                            "vcodec": f.get("vcodec", "none"),
-                            "acodec": f.get("acodec", "none"),
-                            "fps": f.get("fps", 0),
-                            "description": f"{f.get('height', 0)}p ({f.get('width', 0)}x{f.get('height', 0)}) {f.get('ext', '')} - {f.get('vcodec', 'none')}",
-                        }
-                        formats.append(format_info)
-
-                return sorted(formats, key=lambda x: x["height"], reverse=True)
+        try:
+            # Reuse the info dict from a prior fetch before paying for a
+            # second extraction of the same URL
+            info = self._cached_info(url)
+            if info is None:
+                yt_dlp = _load_yt_dlp()
+                ydl_opts = self._base_ydl_opts()
+                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                    info = ydl.extract_info(url, download=False)
+                self._cache_info(url, info)
+
+            formats = []
+            for f in info.get("formats", []):
+                if f.get("height") and f.get("ext"):
+                    format_info = {
+                        "format_id": f.get("format_id", ""),
+                        "height": f.get("height", 0),
+                        "width": f.get("width", 0),
+                        "ext": f.get("ext", ""),
+                        "filesize": f.get("filesize", 0),
+                        "vcodec": f.get("vcodec", "none"),
+                        "acodec": f.get("acodec", "none"),
+                        "fps": f.get("fps", 0),
+                        "description": f"{f.get('height', 0)}p ({f.get('width', 0)}x{f.get('height', 0)}) {f.get('ext', '')} - {f.get('vcodec', 'none')}",
+                    }
+                    formats.append(format_info)
+
+            formats.sort(key=lambda x: x["height"], reverse=True)
+            self._formats_cache[url] = formats
+            return formats
 
         except Exception as e:
             raise Exception(f"Error getting formats: {str(e)}")
 
     def load_settings(self):
-        settings_file = Path(__file__).parent / "settings.json"
+        settings_file = _SETTINGS_PATH
         default_settings = {
             "theme": "system",
             "download_path": self.download_path,
@@ -342,22 +595,23 @@ class YouTubeDownloader:
             "default_format": "MP4 Video",
             "clipboard_monitoring": True,
             "speed_limit": 0,
+            "max_parallel_downloads": 3,
+            "concurrent_fragments": 8,
             "language": "en",  # Add default language setting
         }
         try:
             if settings_file.exists():
-                with open(settings_file, "r") as f:
-                    loaded_settings = json.load(f)
-                    default_settings.update(loaded_settings)
+                with open(settings_file, "rb") as f:
+                    default_settings.update(_json_loads(f.read()))
         except:
             pass
         return default_settings
 
     def save_settings(self):
-        settings_file = Path(__file__).parent / "settings.json"
+        settings_file = _SETTINGS_PATH
         try:
-            with open(settings_file, "w") as f:
-                json.dump(self.settings, f, indent=2)
+            with open(settings_file, "wb") as f:
+                f.write(_json_dumps(self.settings))
         except:
             pass
 
@@ -366,6 +620,88 @@ APP_VERSION = "1.0.0"
 UPDATE_CHECK_URL = "https://example.com/baresha-downloader-version.txt"  # Placeholder
 
 
+# Accepts the YouTube URL forms the downloader understands: any
+# subdomain (www, m, music, ...) and a missing scheme, both of which
+# yt-dlp resolves fine
+_URL_RE = re.compile(r"^(?:https?://)?(?:[\w-]+\.)*(?:youtube\.com|youtu\.be)/")
+
+# Extracts a watch URL from arbitrary clipboard text
+_YT_URL_RE = re.compile(r"(https?://(?:www\.)?youtube\.com/watch\?v=[\w-]+|https?://youtu\.be/[\w-]+)")
+
+# Custom widget styles layered on top of the Sun Valley theme
+_SUN_VALLEY_STYLES = {
+    "Title.TLabel": {"font": ("Segoe UI", 18, "bold"), "foreground": "#ffffff"},
+    "Heading.TLabel": {"font": ("Segoe UI", 11, "bold"), "foreground": "#ffffff"},
+    "Info.TLabel": {"font": ("Segoe UI", 9), "foreground": "#e0e0e0"},
+    "Status.TLabel": {"font": ("Segoe UI", 9), "foreground": "#00ff00"},
+    "Warning.TLabel": {"font": ("Segoe UI", 9), "foreground": "#ffaa00"},
+    "Primary.TButton": {"font": ("Segoe UI", 10, "bold")},
+    "Secondary.TButton": {"font": ("Segoe UI", 9)},
+    "Success.TButton": {"font": ("Segoe UI", 9), "background": "#28a745"},
+    "Warning.TButton": {"font": ("Segoe UI", 9), "background": "#ffc107"},
+}
+
+# Dark styles for the clam-based fallback when Sun Valley is missing
+_FALLBACK_STYLES = {
+    ".": {
+        "background": "#2b2b2b",
+        "foreground": "#ffffff",
+        "fieldbackground": "#3b3b3b",
+        "troughcolor": "#404040",
+        "selectbackground": "#0078d4",
+        "selectforeground": "#ffffff",
+    },
+    "TFrame": {"background": "#2b2b2b"},
+    "TLabelframe": {"background": "#2b2b2b", "bordercolor": "#404040", "lightcolor": "#404040", "darkcolor": "#404040"},
+    "TLabelframe.Label": {"background": "#2b2b2b", "foreground": "#ffffff", "font": ("Segoe UI", 10, "bold")},
+    "TButton": {
+        "background": "#0078d4",
+        "foreground": "#ffffff",
+        "bordercolor": "#0078d4",
+        "lightcolor": "#0078d4",
+        "darkcolor": "#0078d4",
+        "focuscolor": "#0078d4",
+        "font": ("Segoe UI", 9),
+    },
+    "TEntry": {
+        "fieldbackground": "#3b3b3b",
+        "bordercolor": "#404040",
+        "lightcolor": "#404040",
+        "darkcolor": "#404040",
+        "focuscolor": "#0078d4",
+        "font": ("Segoe UI", 9),
+    },
+    "TCombobox": {
+        "fieldbackground": "#3b3b3b",
+        "background": "#3b3b3b",
+        "bordercolor": "#404040",
+        "lightcolor": "#404040",
+        "darkcolor": "#404040",
+        "focuscolor": "#0078d4",
+        "font": ("Segoe UI", 9),
+    },
+    "Horizontal.TProgressbar": {
+        "background": "#0078d4",
+        "bordercolor": "#0078d4",
+        "lightcolor": "#0078d4",
+        "darkcolor": "#0078d4",
+        "troughcolor": "#404040",
+    },
+    "TLabel": {"background": "#2b2b2b", "foreground": "#ffffff", "font": ("Segoe UI", 9)},
+}
+
+# Widget style names resolved once at import; every construction site
+# previously repeated the same SUN_VALLEY_AVAILABLE ternary inline
+_S_TITLE = "Title.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel"
+_S_HEADING = "Heading.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel"
+_S_INFO = "Info.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel"
+_S_STATUS = "Status.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel"
+_S_PRIMARY_BTN = "Primary.TButton" if SUN_VALLEY_AVAILABLE else "TButton"
+_S_SECONDARY_BTN = "Secondary.TButton" if SUN_VALLEY_AVAILABLE else "TButton"
+_S_SUCCESS_BTN = "Success.TButton" if SUN_VALLEY_AVAILABLE else "TButton"
+_S_WARNING_BTN = "Warning.TButton" if SUN_VALLEY_AVAILABLE else "TButton"
+
+
 class YouTubeDownloaderGUI:
     def __init__(self, root):
         self.root = root
@@ -377,7 +713,7 @@ class YouTubeDownloaderGUI:
         self.root.resizable(True, True)
         # Set app icon (window and taskbar)
         try:
-            logo_path = str(Path(__file__).parent / "baresha-logo.jpg")
+            logo_path = str(_LOGO_PATH)
             self.root.iconphoto(True, tk.PhotoImage(file=logo_path))
         except Exception:
             pass
@@ -386,8 +722,19 @@ class YouTubeDownloaderGUI:
         self.current_theme = self.downloader.settings.get("theme", "system")
         self.clipboard_monitoring = self.downloader.settings.get("clipboard_monitoring", True)
         self.last_clipboard_url = None
+        # URLs already taken from the clipboard this session
+        self._seen_clipboard_urls = set()
+        # Decoded thumbnails, LRU-bounded, keyed by URL
+        self._thumb_cache = OrderedDict()
+        # Log lines queue up here and flush to the widget in batches
+        self._log_q = deque()
+        self._log_pending = False
+        # Download workers post (progress, text) pairs here; a 100ms
+        # poll on the main loop applies only the newest values
+        self._progress_q = queue.Queue()
         self.setup_theme()
         self.setup_ui()
+        self.root.after(100, self._drain_progress)
         self.check_for_updates()
         if self.clipboard_monitoring:
             self.start_clipboard_monitor()
@@ -396,112 +743,42 @@ class YouTubeDownloaderGUI:
     def setup_theme(self):
         """Setup Sun Valley theme."""
         if SUN_VALLEY_AVAILABLE:
+            import sv_ttk
+
             if self.current_theme == "system" and DARKDETECT_AVAILABLE:
+                import darkdetect
+
                 theme = "dark" if darkdetect.isDark() else "light"
-            elif self.current_theme == "dark":
-                theme = "dark"
-            elif self.current_theme == "light":
-                theme = "light"
+            elif self.current_theme in ("dark", "light"):
+                theme = self.current_theme
             else:
                 theme = "dark"
+            # Re-selecting the active theme would replay every style
+            # configure through the Tcl interpreter for no visible change
+            if getattr(self, "_theme_applied", None) == theme:
+                return
+            self._theme_applied = theme
             sv_ttk.set_theme(theme)
 
             # Configure custom colors for better contrast
             style = ttk.Style()
-            style.configure("Title.TLabel", font=("Segoe UI", 18, "bold"), foreground="#ffffff")
-
-            style.configure("Heading.TLabel", font=("Segoe UI", 11, "bold"), foreground="#ffffff")
-
-            style.configure("Info.TLabel", font=("Segoe UI", 9), foreground="#e0e0e0")
-
-            style.configure("Status.TLabel", font=("Segoe UI", 9), foreground="#00ff00")
-
-            style.configure("Warning.TLabel", font=("Segoe UI", 9), foreground="#ffaa00")
-
-            # Configure custom button styles
-            style.configure("Primary.TButton", font=("Segoe UI", 10, "bold"))
-
-            style.configure("Secondary.TButton", font=("Segoe UI", 9))
-
-            style.configure("Success.TButton", font=("Segoe UI", 9), background="#28a745")
-
-            style.configure("Warning.TButton", font=("Segoe UI", 9), background="#ffc107")
+            for name, opts in _SUN_VALLEY_STYLES.items():
+                style.configure(name, **opts)
         else:
+            if getattr(self, "_theme_applied", None) == "fallback":
+                return
+            self._theme_applied = "fallback"
             # Fallback to basic dark theme
             style = ttk.Style()
             style.theme_use("clam")
-
-            # Configure dark theme colors
-            style.configure(
-                ".",
-                background="#2b2b2b",
-                foreground="#ffffff",
-                fieldbackground="#3b3b3b",
-                troughcolor="#404040",
-                selectbackground="#0078d4",
-                selectforeground="#ffffff",
-            )
-
-            # Configure frames
-            style.configure("TFrame", background="#2b2b2b")
-            style.configure(
-                "TLabelframe", background="#2b2b2b", bordercolor="#404040", lightcolor="#404040", darkcolor="#404040"
-            )
-            style.configure("TLabelframe.Label", background="#2b2b2b", foreground="#ffffff", font=("Segoe UI", 10, "bold"))
-
-            # Configure buttons
-            style.configure(
-                "TButton",
-                background="#0078d4",
-                foreground="#ffffff",
-                bordercolor="#0078d4",
-                lightcolor="#0078d4",
-                darkcolor="#0078d4",
-                focuscolor="#0078d4",
-                font=("Segoe UI", 9),
-            )
+            for name, opts in _FALLBACK_STYLES.items():
+                style.configure(name, **opts)
             style.map(
                 "TButton",
                 background=[("active", "#106ebe"), ("pressed", "#005a9e")],
                 foreground=[("active", "#ffffff"), ("pressed", "#ffffff")],
             )
 
-            # Configure entry
-            style.configure(
-                "TEntry",
-                fieldbackground="#3b3b3b",
-                bordercolor="#404040",
-                lightcolor="#404040",
-                darkcolor="#404040",
-                focuscolor="#0078d4",
-                font=("Segoe UI", 9),
-            )
-
-            # Configure combobox
-            style.configure(
-                "TCombobox",
-                fieldbackground="#3b3b3b",
-                background="#3b3b3b",
-                bordercolor="#404040",
-                lightcolor="#404040",
-                darkcolor="#404040",
-                focuscolor="#0078d4",
-                font=("Segoe UI", 9),
-            )
-
-            # Configure progress bar
-            style.configure(
-                "Horizontal.TProgressbar",
-                background="#0078d4",
-                bordercolor="#0078d4",
-                lightcolor="#0078d4",
-                darkcolor="#0078d4",
-                troughcolor="#404040",
-            )
-
-            # Configure labels
-            style.configure("TLabel", background="#2b2b2b", foreground="#ffffff", font=("Segoe UI", 9))
-
             # Set window background
             self.root.configure(bg="#2b2b2b")
 
@@ -518,12 +795,10 @@ class YouTubeDownloaderGUI:
         self.status_bar.pack(fill=tk.X, side=tk.BOTTOM, padx=5, pady=(2, 5))
 
         # Status indicators
-        self.status_label = ttk.Label(self.status_bar, text="Ready", style="Info.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel")
+        self.status_label = ttk.Label(self.status_bar, text="Ready", style=_S_INFO)
         self.status_label.pack(side=tk.LEFT)
 
-        self.download_count_label = ttk.Label(
-            self.status_bar, text="Downloads: 0", style="Info.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel"
-        )
+        self.download_count_label = ttk.Label(self.status_bar, text="Downloads: 0", style=_S_INFO)
         self.download_count_label.pack(side=tk.RIGHT)
 
         # Main download tab
@@ -588,16 +863,14 @@ class YouTubeDownloaderGUI:
 
         # Download count with icon
         download_count = len(self.downloader.download_history)
-        count_label = ttk.Label(
-            status_frame, text=f"📥 Downloads: {download_count}", style="Info.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel"
-        )
+        count_label = ttk.Label(status_frame, text=f"📥 Downloads: {download_count}", style=_S_INFO)
         count_label.pack(side=tk.LEFT, padx=(0, 20))
 
         # Language indicator
         lang_label = ttk.Label(
             status_frame,
             text=f"🌐 Language: {self.language.upper()}",
-            style="Info.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel",
+            style=_S_INFO,
         )
         lang_label.pack(side=tk.LEFT)
 
@@ -606,22 +879,37 @@ class YouTubeDownloaderGUI:
         url_frame.grid(row=1, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 10))
         url_frame.columnconfigure(0, weight=1)
 
-        ttk.Label(url_frame, text=self.lang["url_label"], style="Heading.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel").pack(
-            anchor=tk.W, pady=(0, 5)
-        )
+        ttk.Label(url_frame, text=self.lang["url_label"], style=_S_HEADING).pack(anchor=tk.W, pady=(0, 5))
 
         # Change from Entry to Text widget for multiple URLs
         self.url_text = tk.Text(url_frame, height=3, width=70, font=("Segoe UI", 9))
         self.url_text.pack(fill=tk.X, pady=(0, 5))
 
-        # URL count indicator
-        def update_url_count(*args):
+        # URL count indicator, debounced so a paste of many lines scans
+        # the buffer once instead of once per keystroke event
+        self._url_count_after = None
+
+        def do_url_count():
+            self._url_count_after = None
             urls = [u.strip() for u in self.url_text.get("1.0", tk.END).splitlines() if u.strip()]
             self.url_count_label.config(text=f"URLs: {len(urls)}")
 
-        self.url_count_label = ttk.Label(url_frame, text="URLs: 0", style="Info.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel")
+        def update_url_count(*args):
+            if self._url_count_after is not None:
+                self.root.after_cancel(self._url_count_after)
+            self._url_count_after = self.root.after(150, do_url_count)
+
+        def on_url_text_modified(event):
+            # <<Modified>> only fires again after the flag is cleared
+            self.url_text.edit_modified(False)
+            update_url_count()
+
+        self.url_count_label = ttk.Label(url_frame, text="URLs: 0", style=_S_INFO)
         self.url_count_label.pack(anchor=tk.W)
-        self.url_text.bind("<KeyRelease>", update_url_count)
+        # <<Modified>> fires only when the buffer actually changes, unlike
+        # <KeyRelease> which also fires for arrows and modifier keys
+        self.url_text.bind("<<Modified>>", on_url_text_modified)
+        self.url_text.edit_modified(False)
 
         # Drag-and-drop support for URLs
         try:
@@ -653,7 +941,7 @@ class YouTubeDownloaderGUI:
             primary_frame,
             text=self.lang["fetch_info"],
             command=self.fetch_video_info_batch,
-            style="Primary.TButton" if SUN_VALLEY_AVAILABLE else "TButton",
+            style=_S_PRIMARY_BTN,
         )
         self.fetch_btn.pack(side=tk.LEFT, padx=(0, 10))
 
@@ -662,7 +950,7 @@ class YouTubeDownloaderGUI:
             text=self.lang["download_batch"],
             command=self.start_download_batch,
             state=tk.DISABLED,
-            style="Success.TButton" if SUN_VALLEY_AVAILABLE else "TButton",
+            style=_S_SUCCESS_BTN,
         )
         self.download_btn.pack(side=tk.LEFT, padx=(0, 10))
 
@@ -671,7 +959,7 @@ class YouTubeDownloaderGUI:
             text=self.lang["preview"],
             command=self.preview_video,
             state=tk.DISABLED,
-            style="Secondary.TButton" if SUN_VALLEY_AVAILABLE else "TButton",
+            style=_S_SECONDARY_BTN,
         )
         self.preview_btn.pack(side=tk.LEFT, padx=(0, 10))
 
@@ -683,7 +971,7 @@ class YouTubeDownloaderGUI:
             secondary_frame,
             text=self.lang["browse_folder"],
             command=self.browse_folder,
-            style="Secondary.TButton" if SUN_VALLEY_AVAILABLE else "TButton",
+            style=_S_SECONDARY_BTN,
         )
         self.browse_btn.pack(side=tk.LEFT, padx=(0, 10))
 
@@ -691,7 +979,7 @@ class YouTubeDownloaderGUI:
             secondary_frame,
             text=self.lang["open_folder"],
             command=self.open_download_folder,
-            style="Secondary.TButton" if SUN_VALLEY_AVAILABLE else "TButton",
+            style=_S_SECONDARY_BTN,
         )
         self.open_folder_btn.pack(side=tk.LEFT, padx=(0, 10))
 
@@ -699,7 +987,7 @@ class YouTubeDownloaderGUI:
             secondary_frame,
             text=self.lang["clear"],
             command=self.clear_form,
-            style="Warning.TButton" if SUN_VALLEY_AVAILABLE else "TButton",
+            style=_S_WARNING_BTN,
         )
         self.clear_btn.pack(side=tk.LEFT, padx=(0, 10))
 
@@ -707,7 +995,7 @@ class YouTubeDownloaderGUI:
             secondary_frame,
             text="❓ Help",
             command=self.show_shortcuts_help,
-            style="Secondary.TButton" if SUN_VALLEY_AVAILABLE else "TButton",
+            style=_S_SECONDARY_BTN,
         )
         self.help_btn.pack(side=tk.LEFT, padx=(0, 10))
 
@@ -720,7 +1008,7 @@ class YouTubeDownloaderGUI:
             text="⏸️ Pause",
             command=self.pause_download,
             state=tk.DISABLED,
-            style="Secondary.TButton" if SUN_VALLEY_AVAILABLE else "TButton",
+            style=_S_SECONDARY_BTN,
         )
         self.pause_btn.pack(side=tk.LEFT, padx=(0, 5))
         self.resume_btn = ttk.Button(
@@ -728,7 +1016,7 @@ class YouTubeDownloaderGUI:
             text="▶️ Resume",
             command=self.resume_download,
             state=tk.DISABLED,
-            style="Secondary.TButton" if SUN_VALLEY_AVAILABLE else "TButton",
+            style=_S_SECONDARY_BTN,
         )
         self.resume_btn.pack(side=tk.LEFT, padx=(0, 5))
         self.cancel_btn = ttk.Button(
@@ -736,7 +1024,7 @@ class YouTubeDownloaderGUI:
             text="❌ Cancel",
             command=self.cancel_download,
             state=tk.DISABLED,
-            style="Warning.TButton" if SUN_VALLEY_AVAILABLE else "TButton",
+            style=_S_WARNING_BTN,
         )
         self.cancel_btn.pack(side=tk.LEFT, padx=(0, 5))
 
@@ -746,9 +1034,7 @@ class YouTubeDownloaderGUI:
         info_frame.columnconfigure(1, weight=1)
 
         # Thumbnail with better styling
-        self.thumbnail_label = ttk.Label(
-            info_frame, text="No thumbnail", style="Info.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel", anchor="center"
-        )
+        self.thumbnail_label = ttk.Label(info_frame, text="No thumbnail", style=_S_INFO, anchor="center")
         self.thumbnail_label.grid(row=0, column=0, rowspan=5, padx=(0, 15))
 
         # Video details with better layout
@@ -757,45 +1043,35 @@ class YouTubeDownloaderGUI:
         details_frame.columnconfigure(1, weight=1)
 
         # Title with better styling
-        ttk.Label(details_frame, text="📺 Title:", style="Heading.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel").grid(
-            row=0, column=0, sticky=tk.W, pady=(0, 3)
-        )
+        ttk.Label(details_frame, text="📺 Title:", style=_S_HEADING).grid(row=0, column=0, sticky=tk.W, pady=(0, 3))
         self.title_label = ttk.Label(
             details_frame,
             text=self.lang["no_video_selected"],
-            style="Info.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel",
+            style=_S_INFO,
             wraplength=300,
         )
         self.title_label.grid(row=0, column=1, sticky=(tk.W, tk.E), pady=(0, 3))
 
         # Duration with icon
-        ttk.Label(details_frame, text="⏱️ Duration:", style="Heading.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel").grid(
-            row=1, column=0, sticky=tk.W, pady=(0, 3)
-        )
-        self.duration_label = ttk.Label(details_frame, text="--", style="Info.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel")
+        ttk.Label(details_frame, text="⏱️ Duration:", style=_S_HEADING).grid(row=1, column=0, sticky=tk.W, pady=(0, 3))
+        self.duration_label = ttk.Label(details_frame, text="--", style=_S_INFO)
         self.duration_label.grid(row=1, column=1, sticky=(tk.W, tk.E), pady=(0, 3))
 
         # Uploader with icon
-        ttk.Label(details_frame, text="👤 Uploader:", style="Heading.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel").grid(
-            row=2, column=0, sticky=tk.W, pady=(0, 3)
-        )
-        self.uploader_label = ttk.Label(details_frame, text="--", style="Info.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel")
+        ttk.Label(details_frame, text="👤 Uploader:", style=_S_HEADING).grid(row=2, column=0, sticky=tk.W, pady=(0, 3))
+        self.uploader_label = ttk.Label(details_frame, text="--", style=_S_INFO)
         self.uploader_label.grid(row=2, column=1, sticky=(tk.W, tk.E), pady=(0, 3))
 
         # Views with icon
-        ttk.Label(details_frame, text="👁️ Views:", style="Heading.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel").grid(
-            row=3, column=0, sticky=tk.W, pady=(0, 3)
-        )
-        self.views_label = ttk.Label(details_frame, text="--", style="Info.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel")
+        ttk.Label(details_frame, text="👁️ Views:", style=_S_HEADING).grid(row=3, column=0, sticky=tk.W, pady=(0, 3))
+        self.views_label = ttk.Label(details_frame, text="--", style=_S_INFO)
         self.views_label.grid(row=3, column=1, sticky=(tk.W, tk.E), pady=(0, 3))
 
         # Quality and format selection with better styling
         quality_frame = ttk.Frame(details_frame)
         quality_frame.grid(row=4, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 3))
 
-        ttk.Label(quality_frame, text="🎯 Quality:", style="Heading.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel").pack(
-            side=tk.LEFT
-        )
+        ttk.Label(quality_frame, text="🎯 Quality:", style=_S_HEADING).pack(side=tk.LEFT)
         self.quality_var = tk.StringVar(value="Best Quality")
         self.quality_combo = ttk.Combobox(
             quality_frame,
@@ -807,9 +1083,7 @@ class YouTubeDownloaderGUI:
         )
         self.quality_combo.pack(side=tk.LEFT, padx=(5, 15))
 
-        ttk.Label(quality_frame, text="📁 Format:", style="Heading.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel").pack(
-            side=tk.LEFT
-        )
+        ttk.Label(quality_frame, text="📁 Format:", style=_S_HEADING).pack(side=tk.LEFT)
         self.format_var = tk.StringVar(value="MP4 Video")
         self.format_combo = ttk.Combobox(
             quality_frame,
@@ -822,9 +1096,7 @@ class YouTubeDownloaderGUI:
         self.format_combo.pack(side=tk.LEFT, padx=(5, 0))
 
         # Available formats info with icon
-        self.formats_label = ttk.Label(
-            details_frame, text="", style="Info.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel", wraplength=300
-        )
+        self.formats_label = ttk.Label(details_frame, text="", style=_S_INFO, wraplength=300)
         self.formats_label.grid(row=5, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(3, 0))
 
         # Download progress with enhanced styling
@@ -840,9 +1112,7 @@ class YouTubeDownloaderGUI:
         self.progress_bar.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 5))
 
         # Progress label with better styling
-        self.progress_label = ttk.Label(
-            progress_frame, text=self.lang["ready_to_download"], style="Info.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel"
-        )
+        self.progress_label = ttk.Label(progress_frame, text=self.lang["ready_to_download"], style=_S_INFO)
         self.progress_label.grid(row=1, column=0, sticky=tk.W)
 
         # Log section with enhanced styling
@@ -892,22 +1162,30 @@ class YouTubeDownloaderGUI:
         header_frame = ttk.Frame(history_frame)
         header_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), padx=10, pady=5)
 
-        title_label = ttk.Label(
-            header_frame, text=self.lang["download_history"], style="Title.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel"
-        )
+        title_label = ttk.Label(header_frame, text=self.lang["download_history"], style=_S_TITLE)
         title_label.pack(side=tk.LEFT)
 
         # Filter/Search bar
         filter_frame = ttk.Frame(header_frame)
         filter_frame.pack(side=tk.RIGHT)
-        ttk.Label(filter_frame, text="🔎", style="Heading.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel").pack(side=tk.LEFT)
+        ttk.Label(filter_frame, text="🔎", style=_S_HEADING).pack(side=tk.LEFT)
         self.history_search_var = tk.StringVar()
         search_entry = ttk.Entry(filter_frame, textvariable=self.history_search_var, width=30)
         search_entry.pack(side=tk.LEFT, padx=(5, 0))
 
-        def filter_history(*args):
+        # Debounce so fast typing collapses to one rebuild after the
+        # last keystroke instead of a full refresh per character
+        self._history_filter_after = None
+
+        def do_filter():
+            self._history_filter_after = None
             self.refresh_history()
 
+        def filter_history(*args):
+            if self._history_filter_after is not None:
+                self.root.after_cancel(self._history_filter_after)
+            self._history_filter_after = self.root.after(150, do_filter)
+
         self.history_search_var.trace_add("write", filter_history)
 
         # History content
@@ -941,10 +1219,10 @@ class YouTubeDownloaderGUI:
         self.history_tree.bind("<<TreeviewSelect>>", self.show_history_thumbnail)
         self.thumbnail_popup = None
 
-        # Scrollbar
-        history_scrollbar = ttk.Scrollbar(content_frame, orient=tk.VERTICAL, command=self.history_tree.yview)
-        history_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
-        self.history_tree.configure(yscrollcommand=history_scrollbar.set)
+        # Scrollbar; the yscrollcommand hook renders more rows on demand
+        self.history_scrollbar = ttk.Scrollbar(content_frame, orient=tk.VERTICAL, command=self.history_tree.yview)
+        self.history_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.history_tree.configure(yscrollcommand=self._on_history_scroll)
 
         # Buttons
         button_frame = ttk.Frame(content_frame)
@@ -954,13 +1232,13 @@ class YouTubeDownloaderGUI:
             button_frame,
             text=self.lang["refresh"],
             command=self.refresh_history,
-            style="Secondary.TButton" if SUN_VALLEY_AVAILABLE else "TButton",
+            style=_S_SECONDARY_BTN,
         ).pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(
             button_frame,
             text=self.lang["clear_history"],
             command=self.clear_history,
-            style="Warning.TButton" if SUN_VALLEY_AVAILABLE else "TButton",
+            style=_S_WARNING_BTN,
         ).pack(side=tk.LEFT)
 
         self.refresh_history()
@@ -978,9 +1256,7 @@ class YouTubeDownloaderGUI:
         header_frame = ttk.Frame(settings_frame)
         header_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), padx=10, pady=5)
 
-        title_label = ttk.Label(
-            header_frame, text=self.lang["settings"], style="Title.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel"
-        )
+        title_label = ttk.Label(header_frame, text=self.lang["settings"], style=_S_TITLE)
         title_label.pack(side=tk.LEFT)
 
         # Settings content with scrollable area
@@ -1009,7 +1285,7 @@ class YouTubeDownloaderGUI:
             path_frame,
             text=self.lang["browse"],
             command=self.browse_download_path,
-            style="Secondary.TButton" if SUN_VALLEY_AVAILABLE else "TButton",
+            style=_S_SECONDARY_BTN,
         ).pack(side=tk.RIGHT)
 
         # FFmpeg settings
@@ -1018,15 +1294,19 @@ class YouTubeDownloaderGUI:
 
         ffmpeg_status = "✅ Available" if self.downloader.ffmpeg_path else "❌ Not Found"
         ffmpeg_style = "Status.TLabel" if self.downloader.ffmpeg_path else "Warning.TLabel"
-        ttk.Label(ffmpeg_frame, text=f"FFmpeg: {ffmpeg_status}", style=ffmpeg_style).pack(anchor=tk.W)
+        # Kept as attributes so an install can update them in place
+        self._ffmpeg_status_label = ttk.Label(ffmpeg_frame, text=f"FFmpeg: {ffmpeg_status}", style=ffmpeg_style)
+        self._ffmpeg_status_label.pack(anchor=tk.W)
 
+        self._ffmpeg_install_btn = None
         if not self.downloader.ffmpeg_path:
-            ttk.Button(
+            self._ffmpeg_install_btn = ttk.Button(
                 ffmpeg_frame,
                 text=self.lang["install_ffmpeg"],
                 command=self.install_ffmpeg,
-                style="Primary.TButton" if SUN_VALLEY_AVAILABLE else "TButton",
-            ).pack(pady=(5, 0))
+                style=_S_PRIMARY_BTN,
+            )
+            self._ffmpeg_install_btn.pack(pady=(5, 0))
 
         # Theme settings
         theme_frame = ttk.LabelFrame(scrollable_frame, text=self.lang["theme_settings"], padding="8")
@@ -1035,9 +1315,7 @@ class YouTubeDownloaderGUI:
         theme_row = ttk.Frame(theme_frame)
         theme_row.pack(fill=tk.X, pady=(5, 0))
 
-        ttk.Label(theme_row, text=self.lang["theme"], style="Heading.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel").pack(
-            side=tk.LEFT
-        )
+        ttk.Label(theme_row, text=self.lang["theme"], style=_S_HEADING).pack(side=tk.LEFT)
 
         theme_var = tk.StringVar(value=self.current_theme)
         theme_combo = ttk.Combobox(
@@ -1061,7 +1339,7 @@ class YouTubeDownloaderGUI:
             theme_row,
             text=self.lang["apply_theme"],
             command=change_theme,
-            style="Primary.TButton" if SUN_VALLEY_AVAILABLE else "TButton",
+            style=_S_PRIMARY_BTN,
         ).pack(side=tk.LEFT)
 
         # Clipboard monitoring toggle
@@ -1084,7 +1362,7 @@ class YouTubeDownloaderGUI:
             clipboard_frame,
             text=self.lang["apply"],
             command=toggle_clipboard,
-            style="Primary.TButton" if SUN_VALLEY_AVAILABLE else "TButton",
+            style=_S_PRIMARY_BTN,
         ).pack(pady=(5, 0))
 
         # Speed limit
@@ -1094,9 +1372,7 @@ class YouTubeDownloaderGUI:
         speed_row = ttk.Frame(speed_frame)
         speed_row.pack(fill=tk.X, pady=(5, 0))
 
-        ttk.Label(speed_row, text=self.lang["max_speed"], style="Heading.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel").pack(
-            side=tk.LEFT
-        )
+        ttk.Label(speed_row, text=self.lang["max_speed"], style=_S_HEADING).pack(side=tk.LEFT)
 
         self.speed_var = tk.DoubleVar(value=self.downloader.settings.get("speed_limit", 0) / 1024 / 1024)
         speed_entry = ttk.Entry(speed_row, textvariable=self.speed_var, width=8)
@@ -1113,7 +1389,37 @@ class YouTubeDownloaderGUI:
             speed_row,
             text=self.lang["apply"],
             command=apply_speed,
-            style="Primary.TButton" if SUN_VALLEY_AVAILABLE else "TButton",
+            style=_S_PRIMARY_BTN,
+        ).pack(side=tk.LEFT)
+
+        # Fragment concurrency
+        fragments_frame = ttk.LabelFrame(scrollable_frame, text=self.lang["fragment_concurrency"], padding="8")
+        fragments_frame.pack(fill=tk.X, pady=(0, 8))
+
+        fragments_row = ttk.Frame(fragments_frame)
+        fragments_row.pack(fill=tk.X, pady=(5, 0))
+
+        ttk.Label(
+            fragments_row,
+            text=self.lang["fragment_count"],
+            style=_S_HEADING,
+        ).pack(side=tk.LEFT)
+
+        self.fragments_var = tk.IntVar(value=self.downloader.settings.get("concurrent_fragments", 8))
+        fragments_spin = ttk.Spinbox(fragments_row, from_=1, to=16, textvariable=self.fragments_var, width=6)
+        fragments_spin.pack(side=tk.LEFT, padx=(10, 10))
+
+        def apply_fragments():
+            count = max(1, min(16, self.fragments_var.get()))
+            self.downloader.settings["concurrent_fragments"] = count
+            self.downloader.save_settings()
+            self.log_message(f"Fragment concurrency set to {count}")
+
+        ttk.Button(
+            fragments_row,
+            text=self.lang["apply"],
+            command=apply_fragments,
+            style=_S_PRIMARY_BTN,
         ).pack(side=tk.LEFT)
 
         # Statistics
@@ -1126,36 +1432,84 @@ class YouTubeDownloaderGUI:
         ttk.Label(
             stats_frame,
             text=f"{self.lang['total_downloads']} {total_downloads}",
-            style="Info.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel",
+            style=_S_INFO,
         ).pack(anchor=tk.W)
         ttk.Label(
             stats_frame,
             text=f"{self.lang['successful_downloads']} {successful_downloads}",
-            style="Info.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel",
+            style=_S_INFO,
         ).pack(anchor=tk.W)
 
         # Pack canvas and scrollbar
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
+    # How many history rows are materialized per render step
+    _HISTORY_CHUNK = 50
+
     def refresh_history(self):
-        """Refresh the download history."""
-        # Clear existing items
-        for item in self.history_tree.get_children():
-            self.history_tree.delete(item)
+        """Refresh the download history.
+
+        The full (filtered) history backs the view as a plain list and
+        only the first chunk of rows becomes Treeview items; scrolling
+        near the bottom renders the next chunk (_on_history_scroll), so
+        a long history costs neither startup time nor Tk memory yet is
+        fully reachable - the old code hard-capped the view at 50 rows.
+        """
+        self.history_tree.delete(*self.history_tree.get_children())
 
-        # Add history items
         query = getattr(self, "history_search_var", None)
         filter_text = query.get().lower() if query else ""
-        for entry in reversed(self.downloader.download_history[-50:]):  # Show last 50
-            if filter_text:
-                if (
-                    filter_text not in entry["title"].lower()
-                    and filter_text not in entry["status"].lower()
-                    and filter_text not in entry["timestamp"]
-                ):
+        if not filter_text:
+            model = list(reversed(self.downloader.download_history))
+        else:
+            # Lowercase each entry once and keep the result on the dict;
+            # repeated filter passes then do plain substring checks
+            model = []
+            for entry in reversed(self.downloader.download_history):
+                title_lc = entry.get("_title_lc")
+                if title_lc is None:
+                    title_lc = entry["_title_lc"] = entry["title"].lower()
+                status_lc = entry.get("_status_lc")
+                if status_lc is None:
+                    status_lc = entry["_status_lc"] = entry["status"].lower()
+                if filter_text not in title_lc and filter_text not in status_lc and filter_text not in entry["timestamp"]:
                     continue
-            date = datetime.datetime.fromisoformat(entry["timestamp"]).strftime("%Y-%m-%d %H:%M")
+                model.append(entry)
+        self._history_model = model
+        self._history_rendered = 0
+        # Detach the tree while inserting so Tk recomputes layout and
+        # scrollbar extents once for the batch, not per row
+        self.history_tree.grid_remove()
+        try:
+            self._render_history_rows(self._HISTORY_CHUNK)
+        finally:
+            self.history_tree.grid()
+
+    def _schedule_history_refresh(self):
+        """Coalesce refresh requests into one idle-time rebuild.
+
+        Download workers can finish in bursts; rebuilding once when the
+        main loop goes idle replaces one full refresh per completion.
+        """
+        if getattr(self, "_history_refresh_pending", False):
+            return
+        self._history_refresh_pending = True
+        self.root.after_idle(self._do_history_refresh)
+
+    def _do_history_refresh(self):
+        self._history_refresh_pending = False
+        self.refresh_history()
+
+    def _render_history_rows(self, count):
+        """Materialize the next `count` model rows as Treeview items."""
+        start = self._history_rendered
+        for entry in self._history_model[start : start + count]:
+            # Parse and format the timestamp once per entry, not once per
+            # render; repeated filters then reuse the cached string
+            date = entry.get("_date_str")
+            if date is None:
+                date = entry["_date_str"] = datetime.datetime.fromisoformat(entry["timestamp"]).strftime("%Y-%m-%d %H:%M")
             self.history_tree.insert(
                 "",
                 "end",
@@ -1167,6 +1521,13 @@ class YouTubeDownloaderGUI:
                     date,
                 ),
             )
+        self._history_rendered = min(start + count, len(self._history_model))
+
+    def _on_history_scroll(self, first, last):
+        """Render another chunk when the view nears the rendered bottom."""
+        if float(last) > 0.9 and self._history_rendered < len(self._history_model):
+            self._render_history_rows(self._HISTORY_CHUNK)
+        self.history_scrollbar.set(first, last)
 
     def clear_history(self):
         """Clear download history."""
@@ -1183,20 +1544,38 @@ class YouTubeDownloaderGUI:
             self.path_var.set(folder)
 
     def install_ffmpeg(self):
-        """Install FFmpeg."""
-        try:
-            import subprocess
-
-            result = subprocess.run([sys.executable, "install_ffmpeg.py"], capture_output=True, text=True)
-            if result.returncode == 0:
-                messagebox.showinfo("Success", "FFmpeg installed successfully!")
-                # Refresh the settings
-                self.downloader.ffmpeg_path = self.downloader.find_ffmpeg()
-                self.setup_settings_tab()
-            else:
-                messagebox.showerror("Error", f"Failed to install FFmpeg: {result.stderr}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to install FFmpeg: {str(e)}")
+        """Install FFmpeg on a worker thread so the UI keeps running."""
+        if self._ffmpeg_install_btn is not None:
+            self._ffmpeg_install_btn.config(state=tk.DISABLED)
+        self.log_message("Installing FFmpeg...")
+
+        def wait_for_install():
+            try:
+                proc = subprocess.Popen(
+                    [sys.executable, "install_ffmpeg.py"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+                )
+                out, err = proc.communicate()
+                self.root.after(0, lambda: self._on_ffmpeg_install_done(proc.returncode, err))
+            except Exception as e:
+                self.root.after(0, lambda e=e: self._on_ffmpeg_install_done(1, str(e)))
+
+        threading.Thread(target=wait_for_install, daemon=True).start()
+
+    def _on_ffmpeg_install_done(self, returncode, error_output):
+        """Apply the install result to the UI on the main thread."""
+        if returncode == 0:
+            messagebox.showinfo("Success", "FFmpeg installed successfully!")
+            # Update the existing widgets; rebuilding the whole tab
+            # added a duplicate Settings page to the notebook each time
+            self.downloader.ffmpeg_path = self.downloader.find_ffmpeg(use_cache=False)
+            self._ffmpeg_status_label.config(text="FFmpeg: ✅ Available", style=_S_STATUS)
+            if self._ffmpeg_install_btn is not None:
+                self._ffmpeg_install_btn.destroy()
+                self._ffmpeg_install_btn = None
+        else:
+            messagebox.showerror("Error", f"Failed to install FFmpeg: {error_output}")
+            if self._ffmpeg_install_btn is not None:
+                self._ffmpeg_install_btn.config(state=tk.NORMAL)
 
     def clear_form(self):
         """Clear the download form."""
@@ -1213,23 +1592,33 @@ class YouTubeDownloaderGUI:
         self.progress_label.config(text=self.lang["ready_to_download"])
         self.log_text.delete(1.0, tk.END)
 
+    def _get_batch_urls(self):
+        """Split the URL box into deduplicated valid and invalid URLs."""
+        valid = []
+        invalid = []
+        # One pass with one regex match per line; the previous version
+        # matched every line twice to build the two lists
+        for line in self.url_text.get("1.0", tk.END).splitlines():
+            url = line.strip()
+            if not url:
+                continue
+            (valid if _URL_RE.match(url) else invalid).append(url)
+        return list(dict.fromkeys(valid)), invalid
+
     def fetch_video_info_batch(self):
         """Fetch video information for all provided URLs."""
-        urls = [u.strip() for u in self.url_text.get("1.0", tk.END).splitlines() if u.strip()]
-        if not urls:
+        urls, invalid_urls = self._get_batch_urls()
+        if not urls and not invalid_urls:
             messagebox.showerror(self.lang["error"], "Please enter at least one YouTube URL")
             return
 
-        # Validate URLs
-        invalid_urls = []
-        for url in urls:
-            if not ("youtube.com" in url or "youtu.be" in url):
-                invalid_urls.append(url)
-
         if invalid_urls:
             messagebox.showwarning(
                 "Invalid URLs", f"The following URLs may not be valid YouTube links:\n{', '.join(invalid_urls[:3])}"
             )
+            # Warn but still try them - yt-dlp accepts forms the strict
+            # pattern misses, and per-URL errors surface in the log
+            urls = list(dict.fromkeys(urls + invalid_urls))
 
         self.fetch_btn.config(state=tk.DISABLED)
         self.log_message(f"Fetching video information for {len(urls)} URL(s)...")
@@ -1237,21 +1626,17 @@ class YouTubeDownloaderGUI:
 
         def fetch_thread():
             errors = 0
-            for url in urls:
-                try:
-                    info = self.downloader.get_video_info(url)
+            for url, info, error_msg in self.downloader.get_video_info_many(urls):
+                if info is not None:
                     self.batch_video_info.append(info)
-                except Exception as e:
-                    error_msg = str(e)
-                    if "Video unavailable" in error_msg:
-                        self.log_message(f"Video unavailable: {url}", error=True)
-                    elif "Private video" in error_msg:
-                        self.log_message(f"Private video: {url}", error=True)
-                    elif "Video unavailable" in error_msg:
-                        self.log_message(f"Video unavailable: {url}", error=True)
-                    else:
-                        self.log_message(f"Error fetching info for {url}: {error_msg}", error=True)
-                    errors += 1
+                    continue
+                if "Video unavailable" in error_msg:
+                    self.log_message(f"Video unavailable: {url}", error=True)
+                elif "Private video" in error_msg:
+                    self.log_message(f"Private video: {url}", error=True)
+                else:
+                    self.log_message(f"Error fetching info for {url}: {error_msg}", error=True)
+                errors += 1
 
             self.root.after(0, lambda: self.update_video_info_batch(errors))
 
@@ -1270,7 +1655,6 @@ class YouTubeDownloaderGUI:
 
     def start_download_batch(self):
         """Start batch download process."""
-        urls = [u.strip() for u in self.url_text.get("1.0", tk.END).splitlines() if u.strip()]
         if not hasattr(self, "batch_video_info") or not self.batch_video_info:
             messagebox.showerror("Error", "Please fetch video information first")
             return
@@ -1299,37 +1683,56 @@ class YouTubeDownloaderGUI:
 
         def batch_thread():
             total = len(self.batch_video_info)
-            for idx, info in enumerate(self.batch_video_info):
+            workers = min(self.downloader.max_parallel_downloads, total)
+            # Downloads are network-bound, so concurrent videos raise
+            # aggregate throughput; share the speed limit across workers
+            original_limit = self.downloader.speed_limit
+            if original_limit and workers > 1:
+                self.downloader.speed_limit = original_limit // workers
+            # Per-video completion fraction, summed for overall progress
+            progress_by_idx = {}
+            progress_lock = threading.Lock()
+
+            def report_progress():
+                with progress_lock:
+                    batch_progress = (sum(progress_by_idx.values()) / total) * 100
+                self._progress_q.put_nowait((batch_progress, None))
+
+            def download_one(idx, info):
                 if self._cancel_event.is_set():
-                    self.root.after(0, lambda: self.log_message("Batch download canceled.", error=True))
-                    break
+                    return
                 while not self._pause_event.is_set():
                     time.sleep(0.2)
                 url = info["webpage_url"]
                 title = info["title"]
                 # If a partial file exists, log that we are resuming
-                outtmpl = os.path.join(self.downloader.download_path, "%s.*" % info["title"])
                 partials = list(Path(self.downloader.download_path).glob(f"{info['title']}.*.part"))
                 if partials:
                     self.root.after(0, lambda: self.log_message(f"Resuming download: {info['title']}"))
 
+                last_ui = [0.0]
+
                 def progress_hook(d, idx=idx):
                     if d["status"] == "downloading":
+                        # Per-chunk callbacks arrive far faster than the
+                        # bar can usefully move; cap this worker at ~10Hz
+                        now = time.monotonic()
+                        if now - last_ui[0] < 0.1:
+                            return
+                        last_ui[0] = now
                         if "total_bytes" in d and d["total_bytes"]:
-                            progress = (d["downloaded_bytes"] / d["total_bytes"]) * 100
-                            # Batch progress: (current video idx + percent of current) / total
-                            batch_progress = ((idx + progress / 100) / total) * 100
-                            self.root.after(0, lambda: self.progress_var.set(batch_progress))
+                            with progress_lock:
+                                progress_by_idx[idx] = d["downloaded_bytes"] / d["total_bytes"]
+                            report_progress()
                         speed = d.get("speed", 0)
                         if speed:
                             speed_mb = speed / 1024 / 1024
-                            self.root.after(
-                                0,
-                                lambda: self.progress_label.config(text=f"Downloading {idx+1}/{total}... {speed_mb:.1f} MB/s"),
-                            )
+                            self._progress_q.put_nowait((None, f"Downloading {idx+1}/{total}... {speed_mb:.1f} MB/s"))
                     elif d["status"] == "finished":
-                        self.root.after(0, lambda: self.progress_label.config(text=f"Completed {idx+1}/{total}"))
-                        self.root.after(0, lambda: self.progress_var.set(((idx + 1) / total) * 100))
+                        with progress_lock:
+                            progress_by_idx[idx] = 1
+                        self._progress_q.put_nowait((None, f"Completed {idx+1}/{total}"))
+                        report_progress()
 
                 try:
                     self.downloader.download_video(url, self.downloader.download_path, quality, format_type, progress_hook)
@@ -1340,7 +1743,16 @@ class YouTubeDownloaderGUI:
                     self.root.after(0, lambda e=e: self.log_message(f"Failed: {title} ({str(e)})"))
                     self.downloader.add_to_history(url, title, quality, format_type, "failed")
                     self.root.after(0, lambda: self.notify(self.lang["app_title"], f"{title} - Download failed!"))
-                self.root.after(0, self.refresh_history)
+                self.root.after(0, self._schedule_history_refresh)
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(download_one, idx, info) for idx, info in enumerate(self.batch_video_info)]
+                for future in futures:
+                    future.result()
+
+            self.downloader.speed_limit = original_limit
+            if self._cancel_event.is_set():
+                self.root.after(0, lambda: self.log_message("Batch download canceled.", error=True))
             self.root.after(0, lambda: self.download_btn.config(state=tk.NORMAL))
             self.root.after(0, lambda: self.pause_btn.config(state=tk.DISABLED))
             self.root.after(0, lambda: self.resume_btn.config(state=tk.DISABLED))
@@ -1406,29 +1818,52 @@ class YouTubeDownloaderGUI:
         self.preview_btn.config(state=tk.NORMAL)
         self.log_message("Video information loaded successfully")
 
+    # Upper bound on cached thumbnail PhotoImages
+    _THUMB_CACHE_SIZE = 32
+
     def load_thumbnail(self, url):
         """Load and display video thumbnail."""
-        try:
+        # Re-previewing a video in the same session skips the network
+        cached = self._thumb_cache.get(url)
+        if cached is not None:
+            self._thumb_cache.move_to_end(url)
+            self.thumbnail_label.config(image=cached, text="")
+            self.thumbnail_label.image = cached
+            return
 
-            def load_thread():
-                try:
-                    response = requests.get(url, timeout=10)
-                    if response.status_code == 200:
-                        image = Image.open(requests.get(url, stream=True).raw)
-                        image = image.resize((160, 120), Image.LANCZOS)
-                        photo = ImageTk.PhotoImage(image)
-                        self.root.after(0, lambda: self.thumbnail_label.config(image=photo, text=""))
+        def fetch_and_decode():
+            from PIL import Image
 
-                        def set_image():
-                            self.thumbnail_label.image = photo
+            response = self.downloader.get_http_session().get(url, timeout=10)
+            response.raise_for_status()
+            image = Image.open(io.BytesIO(response.content))
+            # draft lets libjpeg decode at a reduced scale, so most of
+            # the full-size pixels are never produced
+            image.draft("RGB", (160, 120))
+            image.thumbnail((160, 120), Image.LANCZOS)
+            return image
 
-                        self.root.after(0, set_image)
-                except Exception as e:
-                    self.root.after(0, lambda: self.thumbnail_label.config(text="Thumbnail error"))
+        def on_done(future):
+            try:
+                image = future.result()
+            except Exception:
+                self.root.after(0, lambda: self.thumbnail_label.config(text="Thumbnail error"))
+                return
+            self.root.after(0, lambda: self._install_thumbnail(url, image))
 
-            threading.Thread(target=load_thread, daemon=True).start()
-        except Exception as e:
-            self.thumbnail_label.config(text="Thumbnail error")
+        THUMB_POOL.submit(fetch_and_decode).add_done_callback(on_done)
+
+    def _install_thumbnail(self, url, image):
+        """Create the PhotoImage on the Tk main thread and display it."""
+        from PIL import ImageTk
+
+        photo = ImageTk.PhotoImage(image)
+        self._thumb_cache[url] = photo
+        self._thumb_cache.move_to_end(url)
+        while len(self._thumb_cache) > self._THUMB_CACHE_SIZE:
+            self._thumb_cache.popitem(last=False)
+        self.thumbnail_label.config(image=photo, text="")
+        self.thumbnail_label.image = photo
 
     def browse_folder(self):
         """Open folder browser dialog."""
@@ -1468,33 +1903,39 @@ class YouTubeDownloaderGUI:
         def download_thread():
             try:
 
+                last_ui = [0.0]
+
                 def progress_hook(d):
                     if d["status"] == "downloading":
+                        # yt-dlp fires per chunk; ~10Hz is plenty for the eye
+                        now = time.monotonic()
+                        if now - last_ui[0] < 0.1:
+                            return
+                        last_ui[0] = now
+                        progress = None
                         if "total_bytes" in d and d["total_bytes"]:
                             progress = (d["downloaded_bytes"] / d["total_bytes"]) * 100
-                            self.root.after(0, lambda: self.progress_var.set(progress))
-
+                        text = None
                         speed = d.get("speed", 0)
                         if speed:
-                            speed_mb = speed / 1024 / 1024
-                            self.root.after(0, lambda: self.progress_label.config(text=f"Downloading... {speed_mb:.1f} MB/s"))
-
+                            text = f"Downloading... {speed / 1024 / 1024:.1f} MB/s"
+                        if progress is not None or text is not None:
+                            self._progress_q.put_nowait((progress, text))
                     elif d["status"] == "finished":
-                        self.root.after(0, lambda: self.progress_label.config(text="Download completed!"))
-                        self.root.after(0, lambda: self.progress_var.set(100))
+                        self._progress_q.put_nowait((100, "Download completed!"))
 
                 self.downloader.download_video(url, self.downloader.download_path, quality, format_type, progress_hook)
                 self.root.after(0, lambda: self.log_message("Download completed successfully!"))
 
                 # Add to history
                 self.downloader.add_to_history(url, self.video_info["title"], quality, format_type)
-                self.root.after(0, self.refresh_history)
+                self.root.after(0, self._schedule_history_refresh)
 
             except Exception as e:
                 self.root.after(0, lambda e=e: self.show_error(f"Download failed: {str(e)}"))
                 # Add failed download to history
                 self.downloader.add_to_history(url, self.video_info["title"], quality, format_type, "failed")
-                self.root.after(0, self.refresh_history)
+                self.root.after(0, self._schedule_history_refresh)
             finally:
                 self.root.after(0, lambda: self.download_btn.config(state=tk.NORMAL))
 
@@ -1515,14 +1956,61 @@ class YouTubeDownloaderGUI:
             messagebox.showerror("Error", f"Could not open browser: {str(e)}")
 
     def log_message(self, message, error=False):
-        """Add a message to the log. If error=True, highlight in red."""
-        if error:
-            self.log_text.insert(tk.END, f"{message}\n", "error")
-            self.log_text.tag_config("error", foreground="red")
-        else:
-            self.log_text.insert(tk.END, f"{message}\n")
+        """Add a message to the log. If error=True, highlight in red.
+
+        Lines are queued and flushed on a 50ms tick, so progress-heavy
+        phases redraw the log at most 20 times a second instead of once
+        per message.
+        """
+        self._log_q.append((message, error))
+        if not self._log_pending:
+            self._log_pending = True
+            self.root.after(50, self._flush_log)
+
+    def _flush_log(self):
+        """Insert every queued log line in as few widget calls as possible."""
+        self._log_pending = False
+        if not self._log_q:
+            return
+        self.log_text.tag_config("error", foreground="red")
+        run, run_error = [], False
+        while True:
+            try:
+                message, error = self._log_q.popleft()
+            except IndexError:
+                break
+            if run and error != run_error:
+                self.log_text.insert(tk.END, "\n".join(run) + "\n", *(("error",) if run_error else ()))
+                run = []
+            run.append(message)
+            run_error = error
+        if run:
+            self.log_text.insert(tk.END, "\n".join(run) + "\n", *(("error",) if run_error else ()))
         self.log_text.see(tk.END)
 
+    def _drain_progress(self):
+        """Apply the newest queued progress update, then poll again.
+
+        Hooks fire many times a second per worker; coalescing to the
+        latest value keeps the bar and label current without a redraw
+        per event, and keeps all widget access on the main thread.
+        """
+        latest_progress = latest_text = None
+        while True:
+            try:
+                progress, text = self._progress_q.get_nowait()
+            except queue.Empty:
+                break
+            if progress is not None:
+                latest_progress = progress
+            if text is not None:
+                latest_text = text
+        if latest_progress is not None:
+            self.progress_var.set(latest_progress)
+        if latest_text is not None:
+            self.progress_label.config(text=latest_text)
+        self.root.after(100, self._drain_progress)
+
     def show_error(self, message):
         """Show an error message."""
         messagebox.showerror("Error", message)
@@ -1530,33 +2018,42 @@ class YouTubeDownloaderGUI:
 
     def notify(self, title, message):
         if PLYER_AVAILABLE:
+            from plyer import notification
+
             notification.notify(title=title, message=message, app_name="Baresha Downloader")
         else:
             messagebox.showinfo(title, message)
 
     def start_clipboard_monitor(self):
-        def poll_clipboard():
-            if not self.clipboard_monitoring:
-                return
-            try:
-                clipboard = self.root.clipboard_get()
-                url_match = re.search(
-                    r"(https?://(?:www\.)?youtube\.com/watch\?v=[\w-]+|https?://youtu\.be/[\w-]+)", clipboard
-                )
-                if url_match:
-                    url = url_match.group(0)
-                    if url != self.last_clipboard_url:
-                        self.last_clipboard_url = url
-                        # Insert into url_text if not already present
-                        current = self.url_text.get("1.0", tk.END)
-                        if url not in current:
-                            self.url_text.insert("1.0", url + "\n")
-                            self.log_message(f"Detected YouTube URL from clipboard: {url}")
-            except Exception:
-                pass
-            self.root.after(1500, poll_clipboard)
+        """Check the clipboard on focus and paste events instead of polling.
+
+        The old implementation woke Tk every 1.5s for the app's whole
+        lifetime; binding the checks to the moments a URL can actually
+        arrive removes the steady-state timer entirely.
+        """
+        if getattr(self, "_clipboard_bound", False):
+            return
+        self._clipboard_bound = True
+        self.root.bind("<FocusIn>", self.check_clipboard, add="+")
+        self.url_text.bind("<FocusIn>", self.check_clipboard, add="+")
+        self.root.bind_all("<<Paste>>", self.check_clipboard, add="+")
 
-        self.root.after(1500, poll_clipboard)
+    def check_clipboard(self, event=None):
+        if not self.clipboard_monitoring:
+            return
+        try:
+            clipboard = self.root.clipboard_get()
+        except Exception:
+            return
+        url_match = _YT_URL_RE.search(clipboard)
+        if url_match:
+            url = url_match.group(0)
+            # The seen-set replaces rescanning the whole Text widget per check
+            if url != self.last_clipboard_url and url not in self._seen_clipboard_urls:
+                self.last_clipboard_url = url
+                self._seen_clipboard_urls.add(url)
+                self.url_text.insert("1.0", url + "\n")
+                self.log_message(f"Detected YouTube URL from clipboard: {url}")
 
     def pause_download(self):
         if hasattr(self, "_pause_event"):
@@ -1593,14 +2090,17 @@ class YouTubeDownloaderGUI:
             return
         # Try to get thumbnail from video info
         try:
+            from PIL import Image, ImageTk
+
             info = self.downloader.get_video_info(entry["url"])
             thumb_url = info.get("thumbnail", "")
             if not thumb_url:
                 return
-            response = requests.get(thumb_url, timeout=10)
+            response = self.downloader.get_http_session().get(thumb_url, timeout=10)
             if response.status_code == 200:
-                image = Image.open(requests.get(thumb_url, stream=True).raw)
-                image = image.resize((320, 180), Image.LANCZOS)
+                image = Image.open(io.BytesIO(response.content))
+                image.draft("RGB", (320, 180))
+                image.thumbnail((320, 180), Image.LANCZOS)
                 photo = ImageTk.PhotoImage(image)
                 if self.thumbnail_popup:
                     self.thumbnail_popup.destroy()
@@ -1644,9 +2144,19 @@ class YouTubeDownloaderGUI:
         if not PYSTRAY_AVAILABLE:
             return
         try:
-            logo_path = str(Path(__file__).parent / "baresha-logo.jpg")
-            image = Image.open(logo_path)
-            image = image.resize((64, 64), Image.LANCZOS)
+            import pystray
+            from pystray import MenuItem as item
+            from PIL import Image
+
+            # The resized tray icon is identical every run, so resample the
+            # JPEG once and reuse the tiny PNG on later launches
+            cached_logo = _MODULE_DIR / "baresha-logo-64.png"
+            if not cached_logo.exists():
+                image = Image.open(_LOGO_PATH)
+                image.draft("RGB", (64, 64))
+                image = image.resize((64, 64), Image.LANCZOS)
+                image.save(cached_logo)
+            image = Image.open(cached_logo)
 
             menu = pystray.Menu(
                 item("Show", self.show_window),
@@ -1727,9 +2237,7 @@ F5 - Refresh history
         header_frame = ttk.Frame(batch_frame)
         header_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), padx=10, pady=5)
 
-        title_label = ttk.Label(
-            header_frame, text="Batch Download Manager", style="Title.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel"
-        )
+        title_label = ttk.Label(header_frame, text="Batch Download Manager", style=_S_TITLE)
         title_label.pack(side=tk.LEFT)
 
         # Batch controls
@@ -1740,9 +2248,7 @@ F5 - Refresh history
         url_frame = ttk.Frame(controls_frame)
         url_frame.pack(fill=tk.X, pady=(0, 10))
 
-        ttk.Label(url_frame, text="URLs (one per line):", style="Heading.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel").pack(
-            anchor=tk.W
-        )
+        ttk.Label(url_frame, text="URLs (one per line):", style=_S_HEADING).pack(anchor=tk.W)
 
         self.batch_url_text = tk.Text(url_frame, height=6, width=70, font=("Segoe UI", 9))
         self.batch_url_text.pack(fill=tk.X, pady=(5, 0))
@@ -1755,9 +2261,7 @@ F5 - Refresh history
         quality_frame = ttk.Frame(options_frame)
         quality_frame.pack(fill=tk.X, pady=(0, 10))
 
-        ttk.Label(quality_frame, text="Quality:", style="Heading.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel").pack(
-            side=tk.LEFT
-        )
+        ttk.Label(quality_frame, text="Quality:", style=_S_HEADING).pack(side=tk.LEFT)
         self.batch_quality_var = tk.StringVar(value="Best Quality")
         self.batch_quality_combo = ttk.Combobox(
             quality_frame,
@@ -1769,9 +2273,7 @@ F5 - Refresh history
         )
         self.batch_quality_combo.pack(side=tk.LEFT, padx=(10, 20))
 
-        ttk.Label(quality_frame, text="Format:", style="Heading.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel").pack(
-            side=tk.LEFT
-        )
+        ttk.Label(quality_frame, text="Format:", style=_S_HEADING).pack(side=tk.LEFT)
         self.batch_format_var = tk.StringVar(value="MP4 Video")
         self.batch_format_combo = ttk.Combobox(
             quality_frame,
@@ -1791,7 +2293,7 @@ F5 - Refresh history
             button_frame,
             text="🔍 Fetch All",
             command=self.fetch_batch_info,
-            style="Primary.TButton" if SUN_VALLEY_AVAILABLE else "TButton",
+            style=_S_PRIMARY_BTN,
         )
         self.batch_fetch_btn.pack(side=tk.LEFT, padx=(0, 10))
 
@@ -1800,7 +2302,7 @@ F5 - Refresh history
             text="⬇️ Download All",
             command=self.start_batch_download,
             state=tk.DISABLED,
-            style="Success.TButton" if SUN_VALLEY_AVAILABLE else "TButton",
+            style=_S_SUCCESS_BTN,
         )
         self.batch_download_btn.pack(side=tk.LEFT, padx=(0, 10))
 
@@ -1808,7 +2310,7 @@ F5 - Refresh history
             button_frame,
             text="🧹 Clear",
             command=self.clear_batch_form,
-            style="Warning.TButton" if SUN_VALLEY_AVAILABLE else "TButton",
+            style=_S_WARNING_BTN,
         )
         self.batch_clear_btn.pack(side=tk.LEFT, padx=(0, 10))
 
@@ -1822,9 +2324,7 @@ F5 - Refresh history
         )
         self.batch_progress_bar.pack(fill=tk.X, pady=(0, 5))
 
-        self.batch_progress_label = ttk.Label(
-            progress_frame, text="Ready for batch download", style="Info.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel"
-        )
+        self.batch_progress_label = ttk.Label(progress_frame, text="Ready for batch download", style=_S_INFO)
         self.batch_progress_label.pack(anchor=tk.W)
 
         # Batch log
@@ -1858,9 +2358,7 @@ F5 - Refresh history
         header_frame = ttk.Frame(search_frame)
         header_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), padx=10, pady=5)
 
-        title_label = ttk.Label(
-            header_frame, text="YouTube Search", style="Title.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel"
-        )
+        title_label = ttk.Label(header_frame, text="YouTube Search", style=_S_TITLE)
         title_label.pack(side=tk.LEFT)
 
         # Search controls
@@ -1871,9 +2369,7 @@ F5 - Refresh history
         input_frame = ttk.Frame(search_controls)
         input_frame.pack(fill=tk.X, pady=(0, 10))
 
-        ttk.Label(input_frame, text="Search Query:", style="Heading.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel").pack(
-            anchor=tk.W
-        )
+        ttk.Label(input_frame, text="Search Query:", style=_S_HEADING).pack(anchor=tk.W)
 
         search_entry_frame = ttk.Frame(input_frame)
         search_entry_frame.pack(fill=tk.X, pady=(5, 0))
@@ -1886,7 +2382,7 @@ F5 - Refresh history
             search_entry_frame,
             text="🔍 Search",
             command=self.perform_search,
-            style="Primary.TButton" if SUN_VALLEY_AVAILABLE else "TButton",
+            style=_S_PRIMARY_BTN,
         )
         self.search_btn.pack(side=tk.RIGHT)
 
@@ -1894,9 +2390,7 @@ F5 - Refresh history
         filters_frame = ttk.Frame(search_controls)
         filters_frame.pack(fill=tk.X, pady=(10, 0))
 
-        ttk.Label(filters_frame, text="Filters:", style="Heading.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel").pack(
-            anchor=tk.W, pady=(0, 5)
-        )
+        ttk.Label(filters_frame, text="Filters:", style=_S_HEADING).pack(anchor=tk.W, pady=(0, 5))
 
         filter_options = ttk.Frame(filters_frame)
         filter_options.pack(fill=tk.X)
@@ -1972,7 +2466,7 @@ F5 - Refresh history
             results_buttons,
             text="➕ Add Selected",
             command=self.add_selected_to_batch,
-            style="Success.TButton" if SUN_VALLEY_AVAILABLE else "TButton",
+            style=_S_SUCCESS_BTN,
         )
         self.add_selected_btn.pack(side=tk.LEFT, padx=(0, 10))
 
@@ -1980,7 +2474,7 @@ F5 - Refresh history
             results_buttons,
             text="➕ Add All",
             command=self.add_all_to_batch,
-            style="Success.TButton" if SUN_VALLEY_AVAILABLE else "TButton",
+            style=_S_SUCCESS_BTN,
         )
         self.add_all_btn.pack(side=tk.LEFT, padx=(0, 10))
 
@@ -1988,7 +2482,7 @@ F5 - Refresh history
             results_buttons,
             text="🧹 Clear Results",
             command=self.clear_search_results,
-            style="Warning.TButton" if SUN_VALLEY_AVAILABLE else "TButton",
+            style=_S_WARNING_BTN,
         )
         self.clear_results_btn.pack(side=tk.LEFT)
 
@@ -2005,9 +2499,7 @@ F5 - Refresh history
         header_frame = ttk.Frame(tools_frame)
         header_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), padx=10, pady=5)
 
-        title_label = ttk.Label(
-            header_frame, text="Download Tools", style="Title.TLabel" if SUN_VALLEY_AVAILABLE else "TLabel"
-        )
+        title_label = ttk.Label(header_frame, text="Download Tools", style=_S_TITLE)
         title_label.pack(side=tk.LEFT)
 
         # Tools content
@@ -2031,7 +2523,7 @@ F5 - Refresh history
             url_input_frame,
             text="Convert",
             command=self.convert_url,
-            style="Primary.TButton" if SUN_VALLEY_AVAILABLE else "TButton",
+            style=_S_PRIMARY_BTN,
         ).pack(side=tk.RIGHT)
 
         self.converted_url_text = tk.Text(converter_frame, height=3, wrap=tk.WORD, font=("Consolas", 9))
@@ -2054,7 +2546,7 @@ F5 - Refresh history
             playlist_input_frame,
             text="Extract",
             command=self.extract_playlist,
-            style="Primary.TButton" if SUN_VALLEY_AVAILABLE else "TButton",
+            style=_S_PRIMARY_BTN,
         ).pack(side=tk.RIGHT)
 
         self.playlist_results_text = tk.Text(playlist_frame, height=6, wrap=tk.WORD, font=("Consolas", 9))
@@ -2077,7 +2569,7 @@ F5 - Refresh history
             channel_input_frame,
             text="Get Videos",
             command=self.get_channel_videos,
-            style="Primary.TButton" if SUN_VALLEY_AVAILABLE else "TButton",
+            style=_S_PRIMARY_BTN,
         ).pack(side=tk.RIGHT)
 
         self.channel_results_text = tk.Text(channel_frame, height=6, wrap=tk.WORD, font=("Consolas", 9))
@@ -2094,28 +2586,28 @@ F5 - Refresh history
             system_buttons,
             text="🔧 Check FFmpeg",
             command=self.check_ffmpeg_status,
-            style="Secondary.TButton" if SUN_VALLEY_AVAILABLE else "TButton",
+            style=_S_SECONDARY_BTN,
         ).pack(side=tk.LEFT, padx=(0, 10))
 
         ttk.Button(
             system_buttons,
             text="📊 System Info",
             command=self.show_system_info,
-            style="Secondary.TButton" if SUN_VALLEY_AVAILABLE else "TButton",
+            style=_S_SECONDARY_BTN,
         ).pack(side=tk.LEFT, padx=(0, 10))
 
         ttk.Button(
             system_buttons,
             text="🧹 Clear Cache",
             command=self.clear_cache,
-            style="Warning.TButton" if SUN_VALLEY_AVAILABLE else "TButton",
+            style=_S_WARNING_BTN,
         ).pack(side=tk.LEFT, padx=(0, 10))
 
         ttk.Button(
             system_buttons,
             text="🔄 Reset Settings",
             command=self.reset_settings,
-            style="Warning.TButton" if SUN_VALLEY_AVAILABLE else "TButton",
+            style=_S_WARNING_BTN,
         ).pack(side=tk.LEFT)
 
     def fetch_batch_info(self):
@@ -2434,12 +2926,12 @@ Download Path: {self.downloader.download_path}
         ):
             try:
                 # Reset settings file
-                settings_file = Path(__file__).parent / "settings.json"
+                settings_file = _SETTINGS_PATH
                 if settings_file.exists():
                     settings_file.unlink()
 
                 # Reset download history
-                history_file = Path(__file__).parent / "download_history.json"
+                history_file = _HISTORY_PATH
                 if history_file.exists():
                     history_file.unlink()
 
@@ -2481,6 +2973,8 @@ LANGUAGES = {
         "clipboard_toggle": "Auto-detect YouTube URLs from clipboard",
         "apply": "Apply",
         "download_speed_limit": "Download Speed Limit",
+        "fragment_concurrency": "Parallel Fragment Downloads",
+        "fragment_count": "Fragments per video:",
         "max_speed": "Max speed (MB/s, 0 = unlimited):",
         "statistics": "Statistics",
         "total_downloads": "Total Downloads:",
@@ -2527,6 +3021,8 @@ LANGUAGES = {
         "clipboard_toggle": "Zbulo automatikisht URL-të e YouTube nga clipboard",
         "apply": "Apliko",
         "download_speed_limit": "Kufiri i Shpejtësisë së Shkarkimit",
+        "fragment_concurrency": "Shkarkime Paralele të Fragmenteve",
+        "fragment_count": "Fragmente për video:",
         "max_speed": "Shpejtësia maksimale (MB/s, 0 = pa kufi):",
         "statistics": "Statistikat",
         "total_downloads": "Shkarkime Gjithsej:",